@@ -2,38 +2,42 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from typing import Final
 
 from homeassistant.components import mqtt
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .client import SajH1MqttClient
 from .const import (
     CONF_ENABLE_MQTT_DEBUG,
-    CONF_SCAN_INTERVAL_BATTERY_CONTROLLER_DATA,
-    CONF_SCAN_INTERVAL_BATTERY_DATA,
-    CONF_SCAN_INTERVAL_CONFIG_DATA,
-    CONF_SCAN_INTERVAL_INVERTER_DATA,
-    CONF_SCAN_INTERVAL_REALTIME_DATA,
     CONF_SERIAL_NUMBER,
     DOMAIN,
     LOGGER,
     MQTT_READY,
 )
-from .coordinator import (
-    SajH1MqttBatteryControllerDataCoordinator,
-    SajH1MqttBatteryDataCoordinator,
-    SajH1MqttConfigDataCoordinator,
-    SajH1MqttData,
-    SajH1MqttInverterDataCoordinator,
-    SajH1MqttRealtimeDataCoordinator,
-)
-from .services import async_register_services, async_remove_services
+from .coordinator import build_coordinators
+from .services import async_register_services
 from .types import SajH1MqttConfigEntry
 
-PLATFORMS: list[Platform] = [Platform.NUMBER, Platform.SELECT, Platform.SENSOR]
+PLATFORMS: Final = (Platform.NUMBER, Platform.SELECT, Platform.SENSOR)
+PLATFORM_NAMES: Final = tuple(p.value for p in PLATFORMS)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the integration."""
+    # Create hass data for our domain (to keep track of the mqtt state across entries and reloads)
+    hass.data.setdefault(DOMAIN, {MQTT_READY: False})
+
+    # Register services (only once, they are shared by all config entries)
+    async_register_services(hass)
+
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: SajH1MqttConfigEntry) -> bool:
@@ -43,110 +47,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: SajH1MqttConfigEntry) ->
         LOGGER.error("MQTT integration is not available")
         raise ConfigEntryNotReady("MQTT integration not available")
 
-    # Create hass data for our domain (to keep track of some data)
-    if DOMAIN not in hass.data:
-        hass.data.setdefault(DOMAIN, {MQTT_READY: False})
-
     # Get config data
     serial_number: str = entry.data[CONF_SERIAL_NUMBER]
-    scan_interval_realtime_data = timedelta(
-        seconds=entry.options[CONF_SCAN_INTERVAL_REALTIME_DATA]
-    )
-    # Get optional data
-    interval = entry.options.get(CONF_SCAN_INTERVAL_INVERTER_DATA, None)
-    scan_interval_inverter_data = timedelta(seconds=interval) if interval else None
-    interval = entry.options.get(CONF_SCAN_INTERVAL_BATTERY_DATA, None)
-    scan_interval_battery_data = timedelta(seconds=interval) if interval else None
-    interval = entry.options.get(CONF_SCAN_INTERVAL_BATTERY_CONTROLLER_DATA, None)
-    scan_interval_battery_controller_data = (
-        timedelta(seconds=interval) if interval else None
-    )
-    interval = entry.options.get(CONF_SCAN_INTERVAL_CONFIG_DATA, None)
-    scan_interval_config_data = timedelta(seconds=interval) if interval else None
     debug_mqtt: bool = entry.options.get(CONF_ENABLE_MQTT_DEBUG, False)
-
-    LOGGER.info(f"Setting up SAJ H1 inverter with serial: {serial_number}")
-    LOGGER.info(f"Scan interval realtime data: {scan_interval_realtime_data}")
-    LOGGER.info(
-        f"Scan interval inverter data: {scan_interval_inverter_data or 'disabled'}"
-    )
-    LOGGER.info(
-        f"Scan interval battery data: {scan_interval_battery_data or 'disabled'}"
-    )
-    LOGGER.info(
-        f"Scan interval controller data: {scan_interval_battery_controller_data or 'disabled'}"
-    )
-    LOGGER.info(f"Scan interval config data: {scan_interval_config_data or 'disabled'}")
+    LOGGER.info("Setting up SAJ H1 inverter with serial: %s", serial_number)
 
     # Setup mqtt client
     mqtt_client = SajH1MqttClient(hass, serial_number, debug_mqtt)
     await mqtt_client.connect()
 
-    # Setup coordinators
-    LOGGER.debug("Setting up coordinators")
-
-    # Realtime data coordinator
-    coordinator_realtime_data = SajH1MqttRealtimeDataCoordinator(
-        hass, mqtt_client, scan_interval_realtime_data, "realtime_data"
-    )
-
-    # Inverter data coordinators
-    coordinator_inverter_data: SajH1MqttInverterDataCoordinator | None = None
-    if scan_interval_inverter_data:
-        coordinator_inverter_data = SajH1MqttInverterDataCoordinator(
-            hass, mqtt_client, scan_interval_inverter_data, "inverter_data"
-        )
-
-    # Battery data coordinator
-    coordinator_battery_data: SajH1MqttBatteryDataCoordinator | None = None
-    if scan_interval_battery_data:
-        coordinator_battery_data = SajH1MqttBatteryDataCoordinator(
-            hass, mqtt_client, scan_interval_battery_data, "battery_data"
-        )
-
-    # Battery controller data coordinators
-    coordinator_battery_controller_data: (
-        SajH1MqttBatteryControllerDataCoordinator | None
-    ) = None
-    if scan_interval_battery_controller_data:
-        coordinator_battery_controller_data = SajH1MqttBatteryControllerDataCoordinator(
-            hass,
-            mqtt_client,
-            scan_interval_battery_controller_data,
-            "battery_controller_data",
-        )
-
-    # Config data coordinator
-    coordinator_config_data: SajH1MqttConfigDataCoordinator | None = None
-    if scan_interval_config_data:
-        coordinator_config_data = SajH1MqttConfigDataCoordinator(
-            hass, mqtt_client, scan_interval_config_data, "config_data"
-        )
-
-    # Entry runtime data
-    entry.runtime_data = SajH1MqttData(
-        mqtt_client=mqtt_client,
-        coordinator_realtime_data=coordinator_realtime_data,
-        coordinator_inverter_data=coordinator_inverter_data,
-        coordinator_battery_data=coordinator_battery_data,
-        coordinator_battery_controller_data=coordinator_battery_controller_data,
-        coordinator_config_data=coordinator_config_data,
-    )
+    # Setup coordinators and entry runtime data
+    entry.runtime_data = build_coordinators(hass, mqtt_client, entry.options)
 
     # Trigger first refresh
     # If mqtt ready (or birth message disabled), refresh immediately (case when you reload the integration)
     # If mqtt not ready, wait for mqtt birth message before refresh (case when starting up homeassistant)
-    if hass.data[DOMAIN][MQTT_READY] or not _get_birth_message_topic(hass):
+    if hass.data[DOMAIN][MQTT_READY] or not (
+        birth_message_topic := _get_birth_message_topic(hass)
+    ):
         await entry.runtime_data.async_first_refresh()
     else:
-        await async_first_refresh_on_mqtt_birth_message(hass, entry)
+        await async_first_refresh_on_mqtt_birth_message(
+            hass, entry, birth_message_topic
+        )
 
-    LOGGER.debug(f"Setting up plaforms: {[p.value for p in PLATFORMS]}")
+    LOGGER.debug("Setting up platforms: %s", PLATFORM_NAMES)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services
-    async_register_services(hass)
-
     # Reload entry when it is updated (options flow)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -162,36 +89,38 @@ async def async_unload_entry(hass: HomeAssistant, entry: SajH1MqttConfigEntry) -
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        # Remove services and disconnect the mqtt client
-        async_remove_services(hass)
+        # Disconnect the mqtt client
         await entry.runtime_data.mqtt_client.disconnect()
 
     return unload_ok
 
 
 async def async_first_refresh_on_mqtt_birth_message(
-    hass: HomeAssistant, entry: SajH1MqttConfigEntry
+    hass: HomeAssistant, entry: SajH1MqttConfigEntry, topic: str
 ) -> None:
     """Wait for mqtt birth message before triggering initial refresh.
 
     Because mqtt discovery can delay the birth message,
     we need to wait until the birth message before triggering the initial refresh.
     """
+    # Holder for the unsubscribe callback (only available once subscribed)
+    unsubscribe_callbacks: list[CALLBACK_TYPE] = []
 
     async def on_message(msg: mqtt.ReceiveMessage):
-        LOGGER.debug(f"Received birth message: {msg.payload}")
+        LOGGER.debug("Received birth message: %s", msg.payload)
+
+        # Unsubscribe from the birth topic, we only need the first birth message
+        LOGGER.debug("Unsubscribing from birth topic: %s", topic)
+        while unsubscribe_callbacks:
+            unsubscribe_callbacks.pop()()
+
         # Mark mqtt ready
         hass.data[DOMAIN][MQTT_READY] = True
         # Trigger initial refresh
         await entry.runtime_data.async_first_refresh()
 
-        # Unsubscribe from the birth topic once we have processed it
-        LOGGER.debug(f"Unsubscribing from birth topic: {topic}")
-        unsubscribe_callback()
-
     # Subscribe to the birth message topic
-    topic = _get_birth_message_topic(hass)
-    unsubscribe_callback = await mqtt.async_subscribe(hass, topic, on_message)
+    unsubscribe_callbacks.append(await mqtt.async_subscribe(hass, topic, on_message))
 
 
 def _get_birth_message_topic(hass: HomeAssistant) -> str | None:
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from collections import OrderedDict
-import contextlib
 from datetime import datetime
-from random import random
-from struct import pack, unpack_from
+import logging
+from random import randrange
+from struct import Struct
+from typing import Final
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import ReceiveMessage
@@ -26,9 +26,16 @@ from .const import (
     MQTT_ENCODING,
     MQTT_QOS,
     MQTT_RETAIN,
-    MQTT_WAIT_SLEEP_TIME,
 )
-from .utils import computeCRC, debug, log_hex
+from .utils import computeCRC, log_hex
+
+# Precompiled packet structs
+_HEADER_STRUCT: Final = Struct(">HHIH")  # [LENGTH][REQ_ID][TIMESTAMP][REQ_TYPE]
+_SIZE_STRUCT: Final = Struct(">B")  # [SIZE] of read content
+_WORD_STRUCT: Final = Struct(">H")  # [CRC] checksum
+_WRITE_RESPONSE_STRUCT: Final = Struct(">HHH")  # [REGISTER][VALUE][CRC]
+_MODBUS_REQUEST_STRUCT: Final = Struct(">BBHH")  # [ADDRESS][REQ_TYPE][REGISTER][VALUE]
+_MQTT_HEADER_STRUCT: Final = Struct(">HHBBH")  # [LENGTH][REQ_ID][0x58][0xC9][RANDOM]
 
 
 class SajH1MqttClient:
@@ -51,11 +58,18 @@ class SajH1MqttClient:
             f"saj/{self.serial_number}/{MQTT_DATA_TRANSMISSION_RSP}"
         )
 
-        self.read_responses = OrderedDict()
-        self.write_responses = OrderedDict()
+        # Pending requests (request type and future) by request id, resolved by the response handler
+        self.pending_responses: dict[
+            int, tuple[int, asyncio.Future[memoryview | int]]
+        ] = {}
 
         self.unsubscribe_callbacks = {}
 
+    @property
+    def _debug_mqtt_enabled(self) -> bool:
+        """Return if mqtt packets should be debug logged."""
+        return self.debug_mqtt and LOGGER.isEnabledFor(logging.DEBUG)
+
     async def connect(self) -> None:
         """Connect to mqtt."""
         self.unsubscribe_callbacks = await self._subscribe_topics()
@@ -64,7 +78,7 @@ class SajH1MqttClient:
         """Disconnect from mqtt."""
         for topic, unsubscribe_callback in self.unsubscribe_callbacks.items():
             # Unsubscribe callbacks are not async, so no need to await for them
-            debug(f"Unsubscribing from topic: {topic}")
+            LOGGER.debug("Unsubscribing from topic: %s", topic)
             unsubscribe_callback()
 
     async def read_registers(
@@ -80,97 +94,127 @@ class SajH1MqttClient:
         This method hides all the package splitting and returns the raw bytes if successful.
         It returns None in case data could not be retrieved in time.
         """
-        debug(
-            f"Reading registers at {log_hex(register_start)}, length: {log_hex(register_count)}"
+        (data,) = await self.read_register_blocks(
+            [(register_start, register_count)], timeout
         )
+        return data
+
+    async def read_register_blocks(
+        self,
+        blocks: list[tuple[int, int]],
+        timeout: int = MQTT_DATA_TRANSMISSION_TIMEOUT,
+    ) -> list[bytearray | None]:
+        """Read 1 or more blocks of registers from the inverter.
 
+        The packets of all blocks are published at once, after which all responses are awaited together.
+        It returns the raw bytes per block, or None for a block that could not be retrieved in time.
+        """
         # Create the MQTT data_transmission packets to send to the inverter
         packets: list[tuple[bytes, int]] = []
-        while register_count > 0:
-            reg_count = min(register_count, MODBUS_MAX_REGISTERS_PER_QUERY)
-            packet = self._create_mqtt_read_packet(register_start, reg_count)
-            packets.append(packet)
-            register_start += reg_count
-            register_count -= reg_count
+        block_req_ids: list[list[int]] = []
+        futures: dict[int, asyncio.Future[memoryview | int]] = {}
+        for register_start, register_count in blocks:
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "Reading registers at %s, length: %s",
+                    log_hex(register_start),
+                    log_hex(register_count),
+                )
+            req_ids: list[int] = []
+            while register_count > 0:
+                reg_count = min(register_count, MODBUS_MAX_REGISTERS_PER_QUERY)
+                packet, req_id = self._create_mqtt_read_packet(
+                    register_start, reg_count
+                )
+                # Register the request right away, so the next request ids of the batch are drawn around it
+                future = self.hass.loop.create_future()
+                futures[req_id] = future
+                self.pending_responses[req_id] = (MODBUS_READ_REQUEST, future)
+                packets.append((packet, req_id))
+                req_ids.append(req_id)
+                register_start += reg_count
+                register_count -= reg_count
+            block_req_ids.append(req_ids)
+
         try:
             async with asyncio.timeout(timeout):
-                # Publish the packets
-                req_ids = []
-                for packet, req_id in packets:
-                    req_ids.append(req_id)
-                    self.read_responses[req_id] = None
-                    debug(
-                        f"Publishing packet with request id: {f'{log_hex(req_id)}'}",
-                        self.debug_mqtt,
-                    )
-                    await self.mqtt.async_publish(
-                        self.hass,
-                        self.topic_data_transmission,
-                        packet,
-                        qos=MQTT_QOS,
-                        retain=MQTT_RETAIN,
-                        encoding=MQTT_ENCODING,
+                # Publish the packets (concurrently, so the broker acknowledgements overlap)
+                if self._debug_mqtt_enabled:
+                    LOGGER.debug(
+                        "Publishing packets with request id: %s",
+                        [log_hex(k) for k in futures],
                     )
-                debug("All packets published", self.debug_mqtt)
-
-                # Wait for the answer packets
-                while True:
-                    responses = OrderedDict(
-                        (k, self.read_responses[k])
-                        for k in req_ids
-                        if k in self.read_responses
+                await asyncio.gather(
+                    *(
+                        self.mqtt.async_publish(
+                            self.hass,
+                            self.topic_data_transmission,
+                            packet,
+                            qos=MQTT_QOS,
+                            retain=MQTT_RETAIN,
+                            encoding=MQTT_ENCODING,
+                        )
+                        for packet, _ in packets
                     )
-                    # Check if all responses are returned
-                    if all(responses.values()) is True:
-                        break
-                    debug(
-                        f"Waiting for responses with request id: {[f'{log_hex(k)}' for k in req_ids if responses[k] is None]}",
-                        self.debug_mqtt,
-                    )
-                    await asyncio.sleep(MQTT_WAIT_SLEEP_TIME)
-                debug("All responses received", self.debug_mqtt)
-
-                # Concatenate the payloads, so we get the full answer
-                data = bytearray()
-                for response in responses.values():
-                    data += response
+                )
+                if self._debug_mqtt_enabled:
+                    LOGGER.debug("All packets published")
+
+                # Wait for the answer packets (asyncio.wait does not cancel the futures on timeout)
+                if self._debug_mqtt_enabled:
+                    LOGGER.debug("Waiting for responses")
+                if futures:
+                    await asyncio.wait(futures.values())
+                if self._debug_mqtt_enabled:
+                    LOGGER.debug("All responses received")
         except TimeoutError:
             LOGGER.warning(
                 "Timeout error: the inverter did not answer in the expected timeout"
             )
-            data = None
         except HomeAssistantError as ex:
             LOGGER.warning(
-                f"Could not publish {MQTT_DATA_TRANSMISSION} packets, reason: {ex}"
+                "Could not publish %s packets, reason: %s", MQTT_DATA_TRANSMISSION, ex
             )
-            data = None
-
-        # Remove req_ids from self.read_responses
-        for req_id in req_ids:
-            with contextlib.suppress(KeyError):
-                del self.read_responses[req_id]
-
-        return data
+        finally:
+            # Remove req_ids from self.pending_responses
+            for req_id in futures:
+                self.pending_responses.pop(req_id, None)
+
+        # Concatenate the payloads per block, so we get the full answer of each block
+        blocks_data: list[bytearray | None] = []
+        for req_ids in block_req_ids:
+            responses = [
+                futures[req_id].result() if futures[req_id].done() else None
+                for req_id in req_ids
+            ]
+            # Join preallocates the full block at once
+            blocks_data.append(bytearray().join(responses) if all(responses) else None)
+
+        return blocks_data
 
     async def write_register(
         self,
         register: int,
         value: int,
-        timeout: int = MQTT_DATA_TRANSMISSION_TIMEOUT,
+        timeout: float = MQTT_DATA_TRANSMISSION_TIMEOUT,
     ) -> int | None:
         """Write a register value to the inverter."""
-        debug(f"Writing register {log_hex(register)} with value {log_hex(value)}")
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Writing register %s with value %s", log_hex(register), log_hex(value)
+            )
 
         # Create the MQTT data_transmission packet to send to the inverter
         packet, req_id = self._create_mqtt_write_packet(register, value)
+        future: asyncio.Future[int] = self.hass.loop.create_future()
         try:
             async with asyncio.timeout(timeout):
                 # Publish packet
-                self.write_responses[req_id] = None
-                debug(
-                    f"Publishing packet with request id: {f'{log_hex(req_id)}'}",
-                    self.debug_mqtt,
-                )
+                self.pending_responses[req_id] = (MODBUS_WRITE_REQUEST, future)
+                if self._debug_mqtt_enabled:
+                    LOGGER.debug(
+                        "Publishing packet with request id: %s", log_hex(req_id)
+                    )
                 await self.mqtt.async_publish(
                     self.hass,
                     self.topic_data_transmission,
@@ -181,19 +225,13 @@ class SajH1MqttClient:
                 )
 
                 # Wait for the answer packet
-                while True:
-                    # Check if not None, as we can also get 0 as response
-                    if self.write_responses[req_id] is not None:
-                        break
-                    debug(
-                        f"Waiting for response with request id: {f'{log_hex(req_id)}' if self.write_responses[req_id] is None else ''}",
-                        self.debug_mqtt,
+                if self._debug_mqtt_enabled:
+                    LOGGER.debug(
+                        "Waiting for response with request id: %s", log_hex(req_id)
                     )
-                    await asyncio.sleep(MQTT_WAIT_SLEEP_TIME)
-                debug("Response received", self.debug_mqtt)
-
-                # Get the answer
-                data = self.write_responses[req_id]
+                data = await future
+                if self._debug_mqtt_enabled:
+                    LOGGER.debug("Response received")
         except TimeoutError:
             LOGGER.warning(
                 "Timeout error: the inverter did not answer in expected timeout"
@@ -201,13 +239,12 @@ class SajH1MqttClient:
             data = None
         except HomeAssistantError as ex:
             LOGGER.warning(
-                f"Could not publish {MQTT_DATA_TRANSMISSION} packets, reason: {ex}"
+                "Could not publish %s packets, reason: %s", MQTT_DATA_TRANSMISSION, ex
             )
             data = None
-
-        # Cleanup self.write_responses from request id generated in this method
-        with contextlib.suppress(KeyError):
-            del self.write_responses[req_id]
+        finally:
+            # Cleanup self.pending_responses from request id generated in this method
+            self.pending_responses.pop(req_id, None)
 
         return data
 
@@ -225,7 +262,7 @@ class SajH1MqttClient:
         unsubscribe_callbacks = {}
         for topic_data in topics.values():
             topic = topic_data["topic"]
-            debug(f"Subscribing to topic: {topic}")
+            LOGGER.debug("Subscribing to topic: %s", topic)
             unsubscribe_callbacks[topic] = await self.mqtt.async_subscribe(
                 self.hass,
                 topic,
@@ -240,18 +277,31 @@ class SajH1MqttClient:
     def _handle_data_transmission_rsp(self, msg: ReceiveMessage) -> None:
         """Handle a mqtt data_transmission_rsp response packet."""
         try:
-            debug(f"Received {MQTT_DATA_TRANSMISSION_RSP} packet", self.debug_mqtt)
-            req_id, content = self._parse_packet(msg.payload)
-            if req_id in self.read_responses:
-                self.read_responses[req_id] = content
-            if req_id in self.write_responses:
-                self.write_responses[req_id] = content
+            if self._debug_mqtt_enabled:
+                LOGGER.debug("Received %s packet", MQTT_DATA_TRANSMISSION_RSP)
+            req_id, req_type, content = self._parse_packet(msg.payload)
+            pending = self.pending_responses.get(req_id)
+            if pending is None:
+                return
+            # Ignore responses of another request type (a read response can not answer a write)
+            if pending[0] != req_type:
+                LOGGER.warning(
+                    "Ignoring response with request id %s: expected request type %s, received %s",
+                    log_hex(req_id),
+                    log_hex(pending[0]),
+                    log_hex(req_type),
+                )
+                return
+            # The request keeps its id reserved until it removes its pending entry itself
+            future = pending[1]
+            if not future.done():
+                future.set_result(content)
         except Exception as ex:  # pylint: disable=broad-except
             LOGGER.error(
-                f"Error while handling {MQTT_DATA_TRANSMISSION_RSP} packet: {ex}"
+                "Error while handling %s packet: %s", MQTT_DATA_TRANSMISSION_RSP, ex
             )
 
-    def _parse_packet(self, packet) -> tuple[int, bytearray | int]:
+    def _parse_packet(self, packet: bytes) -> tuple[int, int, memoryview | int]:
         """Parse a mqtt packet.
 
         Packet consists of [HEADER][PACKET_DATA]:
@@ -259,16 +309,17 @@ class SajH1MqttClient:
         - [PACKET_DATA] see specific packet parsing
         """
         # Parse the header
-        length, req_id, timestamp, req_type = unpack_from(">HHIH", packet, 0x00)
+        length, req_id, timestamp, req_type = _HEADER_STRUCT.unpack_from(packet, 0x00)
         req_type -= (
             0x100  # substract 0x100 to match the request type (modbus read or write)
         )
-        date = datetime.fromtimestamp(timestamp)
 
-        debug(f"Request id: {log_hex(req_id)}", self.debug_mqtt)
-        debug(f"Request type: {log_hex(req_type)}", self.debug_mqtt)
-        debug(f"Length: {length} bytes", self.debug_mqtt)
-        debug(f"Timestamp: {date}", self.debug_mqtt)
+        if self._debug_mqtt_enabled:
+            LOGGER.debug("Request id: %s", log_hex(req_id))
+            LOGGER.debug("Request type: %s", log_hex(req_type))
+            LOGGER.debug("Length: %d bytes", length)
+            # The timestamp is only needed for logging, so only convert it here
+            LOGGER.debug("Timestamp: %s", datetime.fromtimestamp(timestamp))
 
         if req_type == MODBUS_READ_REQUEST:
             content = self._parse_read_packet(packet)
@@ -277,9 +328,9 @@ class SajH1MqttClient:
         else:
             raise ValueError(f"Unsupported request type: {log_hex(req_type)}")
 
-        return req_id, content
+        return req_id, req_type, content
 
-    def _parse_read_packet(self, packet) -> bytearray:
+    def _parse_read_packet(self, packet: bytes) -> memoryview:
         """Parse a mqtt read packet.
 
         Packet consists of [SIZE][CONTENT][CRC]:
@@ -287,33 +338,37 @@ class SajH1MqttClient:
         - [CONTENT] of the registers
         - [CRC] checksum
         """
-        # Get the size of the content
-        (size,) = unpack_from(">B", packet, 0xA)
+        # Slice through a memoryview, so the crc input and content are not copied
+        view = memoryview(packet)
 
-        # Get the content
-        content = packet[0xB : 0xB + size]
+        # Get the size of the content
+        (size,) = _SIZE_STRUCT.unpack_from(packet, 0xA)
 
         # Get the CRC
-        (crc16,) = unpack_from(">H", packet, 0xB + size)
+        (crc16,) = _WORD_STRUCT.unpack_from(packet, 0xB + size)
 
         # CRC is calculated starting from "request" at offset 0x3a
-        calc_crc = computeCRC(packet[0x8 : 0xB + size])
+        calc_crc = computeCRC(view[0x8 : 0xB + size])
 
-        debug(f"Response length: {size} bytes", self.debug_mqtt)
-        debug(
-            f"Response bytes: {':'.join(f'{b:02x}' for b in content)}", self.debug_mqtt
-        )
-        debug(
-            f"CRC16: {log_hex(crc16)} -> {'ok' if crc16 == calc_crc else 'bad'}",
-            self.debug_mqtt,
-        )
+        if self._debug_mqtt_enabled:
+            LOGGER.debug(
+                "CRC16: %s -> %s", log_hex(crc16), "ok" if crc16 == calc_crc else "bad"
+            )
 
+        # Validate the CRC first, so corrupt packets are not processed any further
         if crc16 != calc_crc:
-            raise ValueError("Invalid CRC: expected {calc_crc}, received {crc16}")
+            raise ValueError(f"Invalid CRC: expected {calc_crc}, received {crc16}")
+
+        # Get the content (only copied once, when the block responses are joined)
+        content = view[0xB : 0xB + size]
+
+        if self._debug_mqtt_enabled:
+            LOGGER.debug("Response length: %d bytes", size)
+            LOGGER.debug("Response bytes: %s", content.hex(":"))
 
         return content
 
-    def _parse_write_packet(self, packet) -> int:
+    def _parse_write_packet(self, packet: bytes) -> int:
         """Parse a mqtt write packet.
 
         Packet consists of [REGISTER][VALUE][CRC]:
@@ -321,23 +376,26 @@ class SajH1MqttClient:
         - [VALUE] written to the register
         - [CRC] checksum
         """
-        register, value, orig_crc16 = unpack_from(">HHH", packet, 0xA)
-
         # Get the CRC
-        (crc16,) = unpack_from(">H", packet, 0xE)
+        (crc16,) = _WORD_STRUCT.unpack_from(packet, 0xE)
 
         # CRC is calculated starting from "request" at offset 0x3a
-        calc_crc = computeCRC(packet[0x8:0xE])
+        calc_crc = computeCRC(memoryview(packet)[0x8:0xE])
 
-        debug(f"Written register: {log_hex(register)}", self.debug_mqtt)
-        debug(f"Written value: {log_hex(value)}", self.debug_mqtt)
-        debug(
-            f"CRC16: {log_hex(crc16)} -> {'ok' if crc16 == calc_crc else 'bad'}",
-            self.debug_mqtt,
-        )
+        if self._debug_mqtt_enabled:
+            LOGGER.debug(
+                "CRC16: %s -> %s", log_hex(crc16), "ok" if crc16 == calc_crc else "bad"
+            )
 
+        # Validate the CRC first, so corrupt packets are not processed any further
         if crc16 != calc_crc:
-            raise ValueError("Invalid CRC: expected {calc_crc}, received {crc16}")
+            raise ValueError(f"Invalid CRC: expected {calc_crc}, received {crc16}")
+
+        register, value, orig_crc16 = _WRITE_RESPONSE_STRUCT.unpack_from(packet, 0xA)
+
+        if self._debug_mqtt_enabled:
+            LOGGER.debug("Written register: %s", log_hex(register))
+            LOGGER.debug("Written value: %s", log_hex(value))
 
         return value
 
@@ -352,9 +410,10 @@ class SajH1MqttClient:
         - [CONTENT] consists of [DEVICE_ADDRESS][REQ_TYPE][REGISTER_START][REGISTER_COUNT]
         - [CRC] checksum
         """
-        debug("Creating mqtt read packet", self.debug_mqtt)
-        content = pack(
-            ">BBHH", MODBUS_DEVICE_ADDRESS, MODBUS_READ_REQUEST, start, count
+        if self._debug_mqtt_enabled:
+            LOGGER.debug("Creating mqtt read packet")
+        content = _MODBUS_REQUEST_STRUCT.pack(
+            MODBUS_DEVICE_ADDRESS, MODBUS_READ_REQUEST, start, count
         )
 
         return self._create_modbus_mqtt_packet(MODBUS_READ_REQUEST, content)
@@ -370,13 +429,21 @@ class SajH1MqttClient:
         - [CONTENT] consists of [DEVICE_ADDRESS][REQ_TYPE][REGISTER_START][REGISTER_COUNT]
         - [CRC] checksum
         """
-        debug("Creating mqtt write packet", self.debug_mqtt)
-        content = pack(
-            ">BBHH", MODBUS_DEVICE_ADDRESS, MODBUS_WRITE_REQUEST, register, value
+        if self._debug_mqtt_enabled:
+            LOGGER.debug("Creating mqtt write packet")
+        content = _MODBUS_REQUEST_STRUCT.pack(
+            MODBUS_DEVICE_ADDRESS, MODBUS_WRITE_REQUEST, register, value
         )
 
         return self._create_modbus_mqtt_packet(MODBUS_WRITE_REQUEST, content)
 
+    def _new_request_id(self) -> int:
+        """Draw a random request id that is not used by a pending request."""
+        req_id = randrange(0x10000)
+        while req_id in self.pending_responses:
+            req_id = randrange(0x10000)
+        return req_id
+
     def _create_modbus_mqtt_packet(
         self, req_type: int, content: bytes
     ) -> tuple[bytes, int]:
@@ -388,16 +455,23 @@ class SajH1MqttClient:
         crc16 = computeCRC(content)
 
         # Assemble the modbus content into the mqtt packet framework
-        req_id = int(random() * 65536)
-        rand = int(random() * 65536)
-        packet = pack(">HBBH", req_id, 0x58, 0xC9, rand) + content + pack(">H", crc16)
-
-        debug(f"Request id: {log_hex(req_id)}", self.debug_mqtt)
-        debug(f"Request type: {log_hex(req_type)}", self.debug_mqtt)
-        debug(f"CRC16: {log_hex(crc16)}", self.debug_mqtt)
-        debug(f"Request length: {len(packet)} bytes", self.debug_mqtt)
-        debug(f"Request bytes: {':'.join(f'{b:02x}' for b in packet)}", self.debug_mqtt)
+        req_id = self._new_request_id()
+        rand = randrange(0x10000)
+        # The length prefix is known upfront, so the packet is joined in a single allocation
+        length = _MQTT_HEADER_STRUCT.size - 2 + len(content) + 2
+        packet = b"".join(
+            (
+                _MQTT_HEADER_STRUCT.pack(length, req_id, 0x58, 0xC9, rand),
+                content,
+                _WORD_STRUCT.pack(crc16),
+            )
+        )
 
-        packet = pack(">H", len(packet)) + packet
+        if self._debug_mqtt_enabled:
+            LOGGER.debug("Request id: %s", log_hex(req_id))
+            LOGGER.debug("Request type: %s", log_hex(req_type))
+            LOGGER.debug("CRC16: %s", log_hex(crc16))
+            LOGGER.debug("Request length: %d bytes", length)
+            LOGGER.debug("Request bytes: %s", packet[2:].hex(":"))
 
         return packet, req_id
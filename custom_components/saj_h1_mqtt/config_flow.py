@@ -36,20 +36,31 @@ from .const import (
     DOMAIN,
 )
 
+# Scan interval selectors (shared by the config and options schemas)
+SCAN_INTERVAL_REALTIME_DATA_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=10,
+        step=1,
+        mode=NumberSelectorMode.BOX,
+        unit_of_measurement="seconds",
+    )
+)
+SCAN_INTERVAL_OPTIONAL_DATA_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        step=10,
+        mode=NumberSelectorMode.BOX,
+        unit_of_measurement="seconds",
+    )
+)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_SERIAL_NUMBER): cv.string,
         vol.Required(
             CONF_SCAN_INTERVAL_REALTIME_DATA,
             default=DEFAULT_SCAN_INTERVAL.seconds,
-        ): NumberSelector(
-            NumberSelectorConfig(
-                min=10,
-                step=1,
-                mode=NumberSelectorMode.BOX,
-                unit_of_measurement="seconds",
-            )
-        ),
+        ): SCAN_INTERVAL_REALTIME_DATA_SELECTOR,
         vol.Optional(
             CONF_ENABLE_SERIAL_NUMBER_PREFIX,
             default=False,
@@ -62,58 +73,23 @@ OPTIONS_SCHEMA = vol.Schema(
         vol.Required(
             CONF_SCAN_INTERVAL_REALTIME_DATA,
             default=DEFAULT_SCAN_INTERVAL.seconds,
-        ): NumberSelector(
-            NumberSelectorConfig(
-                min=10,
-                step=1,
-                mode=NumberSelectorMode.BOX,
-                unit_of_measurement="seconds",
-            )
-        ),
+        ): SCAN_INTERVAL_REALTIME_DATA_SELECTOR,
         vol.Optional(
             CONF_SCAN_INTERVAL_INVERTER_DATA,
             default=0,
-        ): NumberSelector(
-            NumberSelectorConfig(
-                min=0,
-                step=10,
-                mode=NumberSelectorMode.BOX,
-                unit_of_measurement="seconds",
-            )
-        ),
+        ): SCAN_INTERVAL_OPTIONAL_DATA_SELECTOR,
         vol.Optional(
             CONF_SCAN_INTERVAL_BATTERY_DATA,
             default=0,
-        ): NumberSelector(
-            NumberSelectorConfig(
-                min=0,
-                step=10,
-                mode=NumberSelectorMode.BOX,
-                unit_of_measurement="seconds",
-            )
-        ),
+        ): SCAN_INTERVAL_OPTIONAL_DATA_SELECTOR,
         vol.Optional(
             CONF_SCAN_INTERVAL_BATTERY_CONTROLLER_DATA,
             default=0,
-        ): NumberSelector(
-            NumberSelectorConfig(
-                min=0,
-                step=10,
-                mode=NumberSelectorMode.BOX,
-                unit_of_measurement="seconds",
-            )
-        ),
+        ): SCAN_INTERVAL_OPTIONAL_DATA_SELECTOR,
         vol.Optional(
             CONF_SCAN_INTERVAL_CONFIG_DATA,
             default=0,
-        ): NumberSelector(
-            NumberSelectorConfig(
-                min=0,
-                step=10,
-                mode=NumberSelectorMode.BOX,
-                unit_of_measurement="seconds",
-            )
-        ),
+        ): SCAN_INTERVAL_OPTIONAL_DATA_SELECTOR,
         vol.Optional(
             CONF_ENABLE_SERIAL_NUMBER_PREFIX,
             default=False,
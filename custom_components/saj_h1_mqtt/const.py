@@ -3,75 +3,83 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from enum import Enum, StrEnum
+from enum import IntEnum, StrEnum
 import logging
+from typing import Final
 
-DOMAIN = "saj_h1_mqtt"
-BRAND = "SAJ"
-MANUFACTURER = "SAJ Electric"
-MODEL = "H1 series inverter"
-MODEL_SHORT = "H1"
+DOMAIN: Final = "saj_h1_mqtt"
+BRAND: Final = "SAJ"
+MANUFACTURER: Final = "SAJ Electric"
+MODEL: Final = "H1 series inverter"
+MODEL_SHORT: Final = "H1"
 
 # Configuration constants
-CONF_SERIAL_NUMBER = "serial_number"
-CONF_SCAN_INTERVAL_REALTIME_DATA = "scan_interval_realtime_data"
-CONF_SCAN_INTERVAL_INVERTER_DATA = "scan_interval_inverter_data"
-CONF_SCAN_INTERVAL_BATTERY_DATA = "scan_interval_battery_data"
-CONF_SCAN_INTERVAL_BATTERY_CONTROLLER_DATA = "scan_interval_battery_controller_data"
-CONF_SCAN_INTERVAL_CONFIG_DATA = "scan_interval_config_data"
-CONF_ENABLE_SERIAL_NUMBER_PREFIX = "enable_serial_number_prefix"
-CONF_ENABLE_ACCURATE_REALTIME_POWER_DATA = "enable_accurate_realtime_power_data"
-CONF_ENABLE_MQTT_DEBUG = "enable_mqtt_debug"
+CONF_SERIAL_NUMBER: Final = "serial_number"
+CONF_SCAN_INTERVAL_REALTIME_DATA: Final = "scan_interval_realtime_data"
+CONF_SCAN_INTERVAL_INVERTER_DATA: Final = "scan_interval_inverter_data"
+CONF_SCAN_INTERVAL_BATTERY_DATA: Final = "scan_interval_battery_data"
+CONF_SCAN_INTERVAL_BATTERY_CONTROLLER_DATA: Final = (
+    "scan_interval_battery_controller_data"
+)
+CONF_SCAN_INTERVAL_CONFIG_DATA: Final = "scan_interval_config_data"
+CONF_ENABLE_SERIAL_NUMBER_PREFIX: Final = "enable_serial_number_prefix"
+CONF_ENABLE_ACCURATE_REALTIME_POWER_DATA: Final = "enable_accurate_realtime_power_data"
+CONF_ENABLE_MQTT_DEBUG: Final = "enable_mqtt_debug"
 
 # Service constants
-SERVICE_READ_REGISTER = "read_register"
-SERVICE_WRITE_REGISTER = "write_register"
-SERVICE_REFRESH_INVERTER_DATA = "refresh_inverter_data"
-SERVICE_REFRESH_BATTERY_DATA = "refresh_battery_data"
-SERVICE_REFRESH_BATTERY_CONTROLLER_DATA = "refresh_battery_controller_data"
-SERVICE_REFRESH_CONFIG_DATA = "refresh_config_data"
+SERVICE_READ_REGISTER: Final = "read_register"
+SERVICE_WRITE_REGISTER: Final = "write_register"
+SERVICE_REFRESH_INVERTER_DATA: Final = "refresh_inverter_data"
+SERVICE_REFRESH_BATTERY_DATA: Final = "refresh_battery_data"
+SERVICE_REFRESH_BATTERY_CONTROLLER_DATA: Final = "refresh_battery_controller_data"
+SERVICE_REFRESH_CONFIG_DATA: Final = "refresh_config_data"
 
 # Attribute constants
-ATTR_CONFIG_ENTRY = "config_entry"
-ATTR_REGISTER = "register"
-ATTR_REGISTER_FORMAT = "register_format"
-ATTR_REGISTER_SIZE = "register_size"
-ATTR_REGISTER_VALUE = "register_value"
-ATTR_APP_MODE = "app_mode"
+ATTR_CONFIG_ENTRY: Final = "config_entry"
+ATTR_REGISTER: Final = "register"
+ATTR_REGISTER_FORMAT: Final = "register_format"
+ATTR_REGISTER_SIZE: Final = "register_size"
+ATTR_REGISTER_VALUE: Final = "register_value"
+ATTR_APP_MODE: Final = "app_mode"
 
 # Modbus constants
-MODBUS_MAX_REGISTERS_PER_QUERY = (
+MODBUS_MAX_REGISTERS_PER_QUERY: Final = (
     0x64  # Absolute max is 123 (0x7b) registers per MQTT packet request (do not exceed)
 )
-MODBUS_DEVICE_ADDRESS = 0x01
-MODBUS_READ_REQUEST = 0x03
-MODBUS_WRITE_REQUEST = 0x06
+MODBUS_DEVICE_ADDRESS: Final = 0x01
+MODBUS_READ_REQUEST: Final = 0x03
+MODBUS_WRITE_REQUEST: Final = 0x06
+MODBUS_WRITE_DEBOUNCE_TIME: Final = 0.25  # time in s to collect writes before sending
+MODBUS_WRITE_ATTEMPTS: Final = 3
+MODBUS_WRITE_RETRY_DELAY: Final = (
+    1  # time in s before the first retry (doubled every retry)
+)
+MODBUS_WRITE_TIMEOUT: Final = 15  # max time in s for a write, including its retries
 
 # Modbus registers
-MODBUS_REG_APP_MODE = 0x3247
-MODBUS_REG_GRID_CHARGE_POWER_LIMIT = 0x3248
-MODBUS_REG_GRID_FEED_POWER_LIMIT = 0x3249
-MODBUS_REG_BATTERY_SOC_BACKUP = 0x3271
-MODBUS_REG_BATTERY_SOC_HIGH = 0x3273
-MODBUS_REG_BATTERY_SOC_LOW = 0x3274
+MODBUS_REG_APP_MODE: Final = 0x3247
+MODBUS_REG_GRID_CHARGE_POWER_LIMIT: Final = 0x3248
+MODBUS_REG_GRID_FEED_POWER_LIMIT: Final = 0x3249
+MODBUS_REG_BATTERY_SOC_BACKUP: Final = 0x3271
+MODBUS_REG_BATTERY_SOC_HIGH: Final = 0x3273
+MODBUS_REG_BATTERY_SOC_LOW: Final = 0x3274
 
 # Mqtt constants
-MQTT_READY = "MQTT_READY"
-MQTT_QOS = 2
-MQTT_RETAIN = False
-MQTT_ENCODING = None
-MQTT_DATA_TRANSMISSION = "data_transmission"
-MQTT_DATA_TRANSMISSION_RSP = "data_transmission_rsp"
-MQTT_DATA_TRANSMISSION_TIMEOUT = 10
-MQTT_WAIT_SLEEP_TIME = 0.05  # time in s
+MQTT_READY: Final = "MQTT_READY"
+MQTT_QOS: Final = 2
+MQTT_RETAIN: Final = False
+MQTT_ENCODING: Final = None
+MQTT_DATA_TRANSMISSION: Final = "data_transmission"
+MQTT_DATA_TRANSMISSION_RSP: Final = "data_transmission_rsp"
+MQTT_DATA_TRANSMISSION_TIMEOUT: Final = 10
 
 # Default constants
-DEFAULT_SCAN_INTERVAL = timedelta(seconds=60)
+DEFAULT_SCAN_INTERVAL: Final = timedelta(seconds=60)
 
-LOGGER = logging.getLogger(__package__)
+LOGGER: Final = logging.getLogger(__package__)
 
 
-class WorkingMode(Enum):
+class WorkingMode(IntEnum):
     """Working mode."""
 
     INIT = 0
@@ -86,7 +94,7 @@ class WorkingMode(Enum):
     RESET = 9
 
 
-class AppMode(Enum):
+class AppMode(IntEnum):
     """App mode."""
 
     SELF_USE = 0
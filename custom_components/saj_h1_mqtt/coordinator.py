@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import timedelta
+from struct import pack_into
+import time
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .client import SajH1MqttClient
-from .const import DOMAIN, LOGGER
-from .utils import log_hex
+from .const import (
+    CONF_SCAN_INTERVAL_BATTERY_CONTROLLER_DATA,
+    CONF_SCAN_INTERVAL_BATTERY_DATA,
+    CONF_SCAN_INTERVAL_CONFIG_DATA,
+    CONF_SCAN_INTERVAL_INVERTER_DATA,
+    CONF_SCAN_INTERVAL_REALTIME_DATA,
+    DOMAIN,
+    LOGGER,
+    MODBUS_WRITE_ATTEMPTS,
+    MODBUS_WRITE_DEBOUNCE_TIME,
+    MODBUS_WRITE_RETRY_DELAY,
+    MODBUS_WRITE_TIMEOUT,
+    MQTT_DATA_TRANSMISSION_TIMEOUT,
+)
 
 
 @dataclass
@@ -19,37 +36,71 @@ class SajH1MqttData:
     """SAJ H1 MQTT data."""
 
     mqtt_client: SajH1MqttClient
-    coordinator_realtime_data: SajH1MqttRealtimeDataCoordinator
-    coordinator_inverter_data: SajH1MqttInverterDataCoordinator | None
-    coordinator_battery_data: SajH1MqttBatteryDataCoordinator | None
-    coordinator_battery_controller_data: (
-        SajH1MqttBatteryControllerDataCoordinator | None
+    coordinator_realtime_data: SajH1MqttDataCoordinator
+    coordinator_inverter_data: SajH1MqttDataCoordinator | None
+    coordinator_battery_data: SajH1MqttDataCoordinator | None
+    coordinator_battery_controller_data: SajH1MqttDataCoordinator | None
+    coordinator_config_data: SajH1MqttDataCoordinator | None
+    coordinators: tuple[SajH1MqttDataCoordinator, ...] = field(init=False, repr=False)
+    _refresh_task: asyncio.Task[None] | None = field(
+        default=None, init=False, repr=False
     )
-    coordinator_config_data: SajH1MqttConfigDataCoordinator | None
+
+    def __post_init__(self) -> None:
+        """Collect the enabled coordinators."""
+        self.coordinators = tuple(
+            coordinator
+            for coordinator in (
+                self.coordinator_realtime_data,
+                self.coordinator_inverter_data,
+                self.coordinator_battery_data,
+                self.coordinator_battery_controller_data,
+                self.coordinator_config_data,
+            )
+            if coordinator
+        )
 
     def mark_coordinators_ready(self) -> None:
         """Mark all coordinators ready."""
-        self.coordinator_realtime_data.ready = True
-        if self.coordinator_inverter_data:
-            self.coordinator_inverter_data.ready = True
-        if self.coordinator_battery_data:
-            self.coordinator_battery_data.ready = True
-        if self.coordinator_battery_controller_data:
-            self.coordinator_battery_controller_data.ready = True
-        if self.coordinator_config_data:
-            self.coordinator_config_data.ready = True
+        for coordinator in self.coordinators:
+            coordinator.ready = True
 
     async def async_refresh_coordinators(self) -> None:
-        """Refresh all coordinators."""
-        await self.coordinator_realtime_data.async_refresh()
-        if self.coordinator_inverter_data:
-            await self.coordinator_inverter_data.async_refresh()
-        if self.coordinator_battery_data:
-            await self.coordinator_battery_data.async_refresh()
-        if self.coordinator_battery_controller_data:
-            await self.coordinator_battery_controller_data.async_refresh()
-        if self.coordinator_config_data:
-            await self.coordinator_config_data.async_refresh()
+        """Refresh all coordinators.
+
+        The register blocks of all coordinators are read with a single batched client call.
+        Overlapping callers join the refresh that is already in flight.
+        """
+        if self._refresh_task and not self._refresh_task.done():
+            LOGGER.debug("Coordinator(s) refresh already in progress")
+            await self._refresh_task
+            return
+
+        # Tracked by the config entry, so it is cancelled when the entry is unloaded
+        coordinator = self.coordinator_realtime_data
+        self._refresh_task = coordinator.config_entry.async_create_background_task(
+            coordinator.hass, self._async_refresh_coordinators(), f"{DOMAIN}_refresh"
+        )
+        try:
+            await self._refresh_task
+        finally:
+            self._refresh_task = None
+
+    async def _async_refresh_coordinators(self) -> None:
+        """Refresh all enabled coordinators with a single batched read."""
+        coordinators = [c for c in self.coordinators if c.ready]
+        try:
+            blocks_data = await self.mqtt_client.read_register_blocks(
+                [(c.reg_start, c.reg_count) for c in coordinators]
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            # Record the failed update on the coordinators, as their own refresh does
+            LOGGER.error("Error while refreshing coordinator(s): %s", err)
+            for coordinator in coordinators:
+                coordinator.async_set_update_error(err)
+            return
+        for coordinator, data in zip(coordinators, blocks_data, strict=True):
+            coordinator.async_set_fetched_data(data)
 
     async def async_first_refresh(self) -> None:
         """Trigger first refresh for all coordinators."""
@@ -58,8 +109,11 @@ class SajH1MqttData:
         await self.async_refresh_coordinators()
 
 
-class SajH1MqttDataCoordinator(DataUpdateCoordinator, ABC):
-    """SAJ H1 MQTT data coordinator."""
+class SajH1MqttDataCoordinator(DataUpdateCoordinator):
+    """SAJ H1 MQTT data coordinator.
+
+    Each coordinator reads a single block of modbus registers.
+    """
 
     def __init__(
         self,
@@ -67,6 +121,8 @@ class SajH1MqttDataCoordinator(DataUpdateCoordinator, ABC):
         mqtt_client: SajH1MqttClient,
         scan_interval: timedelta,
         name: str,
+        reg_start: int,
+        reg_count: int,
     ) -> None:
         """Set up the SajH1MqttDataCoordinator class."""
         super().__init__(
@@ -74,84 +130,245 @@ class SajH1MqttDataCoordinator(DataUpdateCoordinator, ABC):
             LOGGER,
             name=f"{DOMAIN}_{name}_coordinator",
             update_interval=scan_interval,
+            # Only update the entities when the register bytes changed
+            always_update=False,
         )
         self.mqtt_client = mqtt_client
+        self.reg_start = reg_start
+        self.reg_count = reg_count
         self.data: bytearray | None = None
+        # Memoryview on the data, so entities can slice their registers without copying
+        self.data_view: memoryview | None = None
         self.ready = False
+        # Minimum time between 2 fetches, to coalesce refresh bursts into a single modbus read
+        self._min_sample_period = scan_interval.total_seconds() / 2
+        self._last_fetch: float | None = None
+        # Register writes are queued and sent by a single writer task
+        self._write_queue: asyncio.Queue[
+            tuple[int, int, asyncio.Future[int | None]]
+        ] = asyncio.Queue()
+        self._write_task: asyncio.Task[None] | None = None
 
-    @abstractmethod
     async def _async_fetch_data(self) -> bytearray | None:
         """Fetch the latest data from the source."""
-        raise NotImplementedError
+        LOGGER.debug(
+            "Fetching %s at %#x (%d), length: %#x (%d)",
+            self.name,
+            self.reg_start,
+            self.reg_start,
+            self.reg_count,
+            self.reg_count,
+        )
+        return await self.mqtt_client.read_registers(self.reg_start, self.reg_count)
 
     async def _async_update_data(self) -> bytearray | None:
         # If coordinator is not ready (due to mqtt discovery), skip the fetching of the data
         if not self.ready:
-            LOGGER.debug(f"Skipping data fetching, {self.name} not ready yet")
+            LOGGER.debug("Skipping data fetching, %s not ready yet", self.name)
             return None
-        return await self._async_fetch_data()
 
+        # If data was fetched recently, keep the current data
+        now = time.monotonic()
+        if (
+            self.data is not None
+            and self._last_fetch is not None
+            and now - self._last_fetch < self._min_sample_period
+        ):
+            LOGGER.debug("Skipping data fetching, %s fetched recently", self.name)
+            return self.data
 
-class SajH1MqttRealtimeDataCoordinator(SajH1MqttDataCoordinator):
-    """SAJ H1 MQTT realtime data coordinator."""
+        data = await self._async_fetch_data()
+        self._store_fetched_data(data, now)
+        return data
 
-    async def _async_fetch_data(self) -> bytearray | None:
-        """Fetch the realtime data."""
-        reg_start = 0x4000
-        reg_count = 0x100  # 256 registers
-        LOGGER.debug(
-            f"Fetching realtime data at {log_hex(reg_start)}, length: {log_hex(reg_count)}"
+    def _store_fetched_data(self, data: bytearray | None, fetched_at: float) -> None:
+        """Keep track of freshly fetched data."""
+        if data is not None:
+            self._last_fetch = fetched_at
+        self.data_view = memoryview(data) if data is not None else None
+
+    @callback
+    def async_set_fetched_data(self, data: bytearray | None) -> None:
+        """Set data that was fetched outside the coordinator (batched read) and notify the listeners.
+
+        As for the coordinator's own refreshes (always_update=False), the listeners are only notified when the data changed.
+        """
+        unchanged = (
+            not self.always_update and self.last_update_success and data == self.data
         )
-        return await self.mqtt_client.read_registers(reg_start, reg_count)
+        self._store_fetched_data(data, time.monotonic())
+        if unchanged:
+            # Keep data and data_view on the same buffer (written values are applied to the data)
+            self.data = data
+            LOGGER.debug("Skipping listener update, %s did not change", self.name)
+            return
+        self.async_set_updated_data(data)
 
+    async def async_request_forced_refresh(self) -> None:
+        """Request a refresh that ignores the minimum sample period.
 
-class SajH1MqttInverterDataCoordinator(SajH1MqttDataCoordinator):
-    """SAJ H1 MQTT inverter data coordinator."""
+        Used after register writes and explicit refresh requests, which need up to date data.
+        """
+        self._last_fetch = None
+        await self.async_request_refresh()
 
-    async def _async_fetch_data(self) -> bytearray | None:
-        """Fetch the inverter data."""
-        reg_start = 0x8F00
-        reg_count = 0x1E  # 30 registers
-        LOGGER.debug(
-            f"Fetching inverter data at {log_hex(reg_start)}, length: {log_hex(reg_count)}"
-        )
-        return await self.mqtt_client.read_registers(reg_start, reg_count)
+    async def async_write_register(self, register: int, value: int) -> int | None:
+        """Queue a register write and wait for its result.
 
+        The writes are sent by a single writer task. The written values are applied to the data
+        and the entities are updated once when the queue is drained, without reading the registers again.
+        """
+        # A register holds an unsigned 16-bit value, reject others before they reach the packet encoding
+        if not 0 <= value <= 0xFFFF:
+            raise ValueError(f"Invalid register value: {value}")
+        future: asyncio.Future[int | None] = self.hass.loop.create_future()
+        self._write_queue.put_nowait((register, value, future))
+        if self._write_task is None or self._write_task.done():
+            self._write_task = self.config_entry.async_create_background_task(
+                self.hass, self._async_process_writes(), f"{self.name}_writer"
+            )
+        return await future
 
-class SajH1MqttBatteryDataCoordinator(SajH1MqttDataCoordinator):
-    """SAJ H1 MQTT battery data coordinator."""
+    async def _async_process_writes(self) -> None:
+        """Send the queued register writes and update the data afterwards.
 
-    async def _async_fetch_data(self) -> bytearray | None:
-        """Fetch the battery bata."""
-        reg_start = 0x8E00
-        reg_count = 0x50  # 80 registers
-        LOGGER.debug(
-            f"Fetching battery data at {log_hex(reg_start)}, length: {log_hex(reg_count)}"
-        )
-        return await self.mqtt_client.read_registers(reg_start, reg_count)
+        Writes are collected during a short debounce time, coalesced per register and sent ordered by register.
+        """
+        refresh_needed = False
+        writes: list[tuple[int, int, asyncio.Future[int | None]]] = []
+        try:
+            while not self._write_queue.empty():
+                await asyncio.sleep(MODBUS_WRITE_DEBOUNCE_TIME)
+                writes = []
+                while not self._write_queue.empty():
+                    writes.append(self._write_queue.get_nowait())
+                if not await self._async_send_writes(writes):
+                    refresh_needed = True
 
+                # Update once the queue is drained (writes queued during the refresh are picked up afterwards)
+                # Only refresh when a written value could not be applied to the data
+                if self._write_queue.empty():
+                    if refresh_needed:
+                        refresh_needed = False
+                        await self.async_request_forced_refresh()
+                    else:
+                        self.async_update_listeners()
+        finally:
+            # Fail the writes that were not sent (e.g. writer cancelled on unload), so no caller waits forever
+            while not self._write_queue.empty():
+                writes.append(self._write_queue.get_nowait())
+            for register, _, future in writes:
+                if not future.done():
+                    future.set_exception(
+                        HomeAssistantError(f"Write of register {register:#x} aborted")
+                    )
 
-class SajH1MqttBatteryControllerDataCoordinator(SajH1MqttDataCoordinator):
-    """SAJ H1 MQTT battery controller data coordinator."""
+    async def _async_send_writes(
+        self, writes: list[tuple[int, int, asyncio.Future[int | None]]]
+    ) -> bool:
+        """Send register writes and resolve their futures.
 
-    async def _async_fetch_data(self) -> bytearray | None:
-        """Fetch the battery controller data."""
-        reg_start = 0xA000
-        reg_count = 0x24  # 36 registers
-        LOGGER.debug(
-            f"Fetching battery controller data at {log_hex(reg_start)}, length: {log_hex(reg_count)}"
-        )
-        return await self.mqtt_client.read_registers(reg_start, reg_count)
+        Only the last value queued for a register is written, all writes to that register get its result.
+        The written values are applied to the data, returns False if that was not possible for all writes.
+        """
+        pending: dict[int, tuple[int, list[asyncio.Future[int | None]]]] = {}
+        for register, value, future in writes:
+            futures = pending[register][1] if register in pending else []
+            futures.append(future)
+            pending[register] = (value, futures)
 
+        applied = True
+        for register in sorted(pending):
+            value, futures = pending[register]
+            try:
+                result = await self._async_write_register_with_retry(register, value)
+                if not self._apply_written_register(register, result):
+                    applied = False
+            except Exception as err:  # pylint: disable=broad-except
+                applied = False
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(err)
+            else:
+                for future in futures:
+                    if not future.done():
+                        future.set_result(result)
+        return applied
 
-class SajH1MqttConfigDataCoordinator(SajH1MqttDataCoordinator):
-    """SAJ H1 MQTT config data coordinator."""
+    async def _async_write_register_with_retry(
+        self, register: int, value: int
+    ) -> int | None:
+        """Write a register, retrying with an exponential backoff when the inverter did not answer.
 
-    async def _async_fetch_data(self) -> bytearray | None:
-        """Fetch the config data."""
-        reg_start = 0x3247
-        reg_count = 0x2E  # 46 registers
-        LOGGER.debug(
-            f"Fetching config data at {log_hex(reg_start)}, length: {log_hex(reg_count)}"
+        All attempts together are bounded by MODBUS_WRITE_TIMEOUT, so callers never wait longer than that.
+        """
+        loop = self.hass.loop
+        deadline = loop.time() + MODBUS_WRITE_TIMEOUT
+        for attempt in range(MODBUS_WRITE_ATTEMPTS):
+            if attempt:
+                delay = MODBUS_WRITE_RETRY_DELAY * 2 ** (attempt - 1)
+                if loop.time() + delay >= deadline:
+                    break
+                await asyncio.sleep(delay)
+                LOGGER.debug(
+                    "Retrying write of register %#x, attempt %d", register, attempt + 1
+                )
+            result = await self.mqtt_client.write_register(
+                register,
+                value,
+                timeout=min(MQTT_DATA_TRANSMISSION_TIMEOUT, deadline - loop.time()),
+            )
+            if result is not None:
+                return result
+        return None
+
+    def _apply_written_register(self, register: int, value: int | None) -> bool:
+        """Apply a written register value to the data (optimistic update)."""
+        if (
+            value is None
+            or self.data is None
+            or not self.reg_start <= register < self.reg_start + self.reg_count
+        ):
+            return False
+        pack_into(">H", self.data, (register - self.reg_start) * 2, value)
+        return True
+
+
+# Coordinator specs: (name, register start, register count, scan interval config key, required)
+COORDINATOR_SPECS: tuple[tuple[str, int, int, str, bool], ...] = (
+    ("realtime_data", 0x4000, 0x100, CONF_SCAN_INTERVAL_REALTIME_DATA, True),
+    ("inverter_data", 0x8F00, 0x1E, CONF_SCAN_INTERVAL_INVERTER_DATA, False),
+    ("battery_data", 0x8E00, 0x50, CONF_SCAN_INTERVAL_BATTERY_DATA, False),
+    (
+        "battery_controller_data",
+        0xA000,
+        0x24,
+        CONF_SCAN_INTERVAL_BATTERY_CONTROLLER_DATA,
+        False,
+    ),
+    ("config_data", 0x3247, 0x2E, CONF_SCAN_INTERVAL_CONFIG_DATA, False),
+)
+
+
+def build_coordinators(
+    hass: HomeAssistant, mqtt_client: SajH1MqttClient, options: Mapping[str, Any]
+) -> SajH1MqttData:
+    """Build the coordinators for the enabled register blocks.
+
+    Only realtime data is required, all others are optional and disabled when their scan interval is not set.
+    """
+    LOGGER.debug("Setting up coordinators")
+    coordinators: dict[str, SajH1MqttDataCoordinator | None] = {}
+    for name, reg_start, reg_count, conf_key, required in COORDINATOR_SPECS:
+        interval = options[conf_key] if required else options.get(conf_key)
+        scan_interval = timedelta(seconds=interval) if interval else None
+        LOGGER.info("Scan interval %s: %s", name, scan_interval or "disabled")
+        coordinators[f"coordinator_{name}"] = (
+            SajH1MqttDataCoordinator(
+                hass, mqtt_client, scan_interval, name, reg_start, reg_count
+            )
+            if scan_interval
+            else None
         )
-        return await self.mqtt_client.read_registers(reg_start, reg_count)
+
+    return SajH1MqttData(mqtt_client=mqtt_client, **coordinators)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import ABC
 from collections.abc import Callable
 from dataclasses import dataclass
-from struct import unpack_from
+import logging
+from struct import Struct
+from typing import ClassVar, Final
 
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity, EntityDescription
@@ -23,6 +25,10 @@ from .const import (
 )
 from .coordinator import SajH1MqttDataCoordinator
 
+# Lowercase prefixes for entity unique ids and names
+_BRAND_LOWER: Final = BRAND.lower()
+_MODEL_SHORT_LOWER: Final = MODEL_SHORT.lower()
+
 
 @dataclass(frozen=True, kw_only=True)
 class SajH1MqttEntityDescription(EntityDescription):
@@ -36,12 +42,80 @@ class SajH1MqttEntityDescription(EntityDescription):
     value_fn: Callable[[int | float | str | None], int | float | str | None] | None
 
 
+def build_decoder(
+    description: SajH1MqttEntityDescription,
+) -> tuple[Callable[[memoryview], int | float | str | None], int]:
+    """Build the decoder for the raw register bytes of an entity description.
+
+    Only the steps needed by the description are chained, so decoding does not branch.
+    Returns the decoder and the number of bytes it decodes.
+    """
+    data_type = description.modbus_register_data_type
+    scale = description.modbus_register_scale
+    value_fn = description.value_fn
+
+    # Get raw value (>Sxx is custom type to indicate a string of length xx)
+    decoder: Callable[[memoryview], int | float | str | None]
+    if data_type.startswith(">S"):
+        length = int(data_type.removeprefix(">S"))
+
+        def decoder(raw: memoryview) -> str:
+            # Decode straight from the memoryview, strings are ascii padded with null bytes
+            return str(raw, "ascii", "replace").rstrip("\x00")
+    else:
+        unpacker = Struct(data_type)
+        length = unpacker.size
+        unpack_from = unpacker.unpack_from
+
+        def decoder(raw: memoryview) -> int | float:
+            return unpack_from(raw)[0]
+
+    # Take scale into account (scale should ALWAYS contain a .)
+    if scale is not None:
+        unscaled = decoder
+        factor = float(scale)
+        digits = max(0, str(scale)[::-1].find("."))
+        if isinstance(scale, str):
+            # If scale is a str, format the value with the same precision
+            fmt = f"{{:.{digits}f}}".format
+
+            def scaled(raw: memoryview) -> str:
+                return fmt(round(unscaled(raw) * factor, digits))
+
+        elif factor == 1.0:
+            # Unit scale only converts to float, the raw value is an int so rounding is not needed
+
+            def scaled(raw: memoryview) -> float:
+                return float(unscaled(raw))
+
+        else:
+
+            def scaled(raw: memoryview) -> float:
+                return round(unscaled(raw) * factor, digits)
+
+        decoder = scaled
+
+    # Value conversion function
+    if value_fn:
+        unconverted = decoder
+
+        def converted(raw: memoryview) -> int | float | str | None:
+            return value_fn(unconverted(raw))
+
+        decoder = converted
+
+    return decoder, length
+
+
 class SajH1MqttEntity(CoordinatorEntity[SajH1MqttDataCoordinator], Entity, ABC):
     """SAJ H1 MQTT entity.
 
     This is the base abstract class for all entity classes.
     """
 
+    # Entity type, to be set by the entity classes (used in the unique id)
+    _entity_type: ClassVar[str]
+
     def __init__(
         self,
         coordinator: SajH1MqttDataCoordinator,
@@ -53,38 +127,44 @@ class SajH1MqttEntity(CoordinatorEntity[SajH1MqttDataCoordinator], Entity, ABC):
         # Do not remove this assignment, used internally in hass
         self.entity_description: SajH1MqttEntityDescription = description
 
-        # Copy values from entity description
-        self._offset = description.modbus_register_offset
-        self._data_type = description.modbus_register_data_type
-        self._scale = description.modbus_register_scale
-        self._value_fn = description.value_fn
-
-        # Define entity prefixes
-        self._serial_number = coordinator.config_entry.data[CONF_SERIAL_NUMBER]
-        self._use_serial_number_prefix = coordinator.config_entry.options[
+        # Prepare the register decoding (composite entities have no register of their own)
+        offset = description.modbus_register_offset
+        self._decode: Callable[[memoryview], int | float | str | None] | None = None
+        self._raw_slice: slice | None = None
+        if offset is not None:
+            self._decode, reg_length = build_decoder(description)
+            self._raw_slice = slice(offset, offset + reg_length)
+
+        # Last decoded raw bytes and value, to skip decoding when the registers did not change
+        self._cached_raw: bytes | None = None
+        self._cached_value: int | float | str | None = None
+
+        # Define entity prefixes (lowercase, as description keys and entity types are lowercase already)
+        serial_number = coordinator.config_entry.data[CONF_SERIAL_NUMBER]
+        use_serial_number_prefix = coordinator.config_entry.options[
             CONF_ENABLE_SERIAL_NUMBER_PREFIX
         ]
-        self._unique_id_prefix = f"{BRAND}_{self._serial_number}"
-        self._name_prefix = (
-            f"{BRAND}_{self._serial_number}"
-            if self._use_serial_number_prefix
-            else f"{BRAND}_{MODEL_SHORT}"
+        unique_id_prefix = f"{_BRAND_LOWER}_{serial_number.lower()}"
+        name_prefix = (
+            unique_id_prefix
+            if use_serial_number_prefix
+            else f"{_BRAND_LOWER}_{_MODEL_SHORT_LOWER}"
         )
 
         # Set entity attributes (use _entity_type in _attr_unique_id to support sensors with same key, but different type)
         self._attr_unique_id = (
-            f"{self._unique_id_prefix}_{description.key}_{self._entity_type}".lower()
+            f"{unique_id_prefix}_{description.key}_{self._entity_type}"
         )
-        self._attr_name = f"{self._name_prefix}_{description.key}".lower()
+        self._attr_name = f"{name_prefix}_{description.key}"
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._serial_number)},
-            name=f"{BRAND} {self._serial_number}",
+            identifiers={(DOMAIN, serial_number)},
+            name=f"{BRAND} {serial_number}",
             manufacturer=MANUFACTURER,
             model=MODEL,
-            serial_number=self._serial_number,
+            serial_number=serial_number,
         )
 
-        LOGGER.debug(f"Setting up entity: {self.name}")
+        LOGGER.debug("Setting up entity: %s", self.name)
 
     def _custom_native_value(
         self, value: float | str | None
@@ -96,6 +176,12 @@ class SajH1MqttEntity(CoordinatorEntity[SajH1MqttDataCoordinator], Entity, ABC):
         """
         return value
 
+    @property
+    def _log_unit_suffix(self) -> str:
+        """Return the unit suffix for value log messages."""
+        unit = self.unit_of_measurement
+        return f" {unit}" if unit else ""
+
     def _get_native_value(self) -> int | float | str | None:
         """Get the native value for the entity."""
         # Return None if no coordinator data
@@ -105,65 +191,57 @@ class SajH1MqttEntity(CoordinatorEntity[SajH1MqttDataCoordinator], Entity, ABC):
 
         value: int | float | str | None = None
         try:
-            # Get raw sensor value (>Sxx is custom type to indicate a string of length xx)
-            if self._data_type.startswith(">S"):
-                reg_length = int(self._data_type.replace(">S", ""))
-                value = bytearray.decode(
-                    payload[self._offset : self._offset + reg_length]
-                )
+            # Slice the shared memoryview (no copy), only copy the bytes when they changed
+            raw = self.coordinator.data_view[self._raw_slice]
+            if raw == self._cached_raw:
+                value = self._cached_value
             else:
-                (value,) = unpack_from(
-                    self._data_type,
-                    payload,
-                    self._offset,
-                )
-
-            # Set sensor value (taking scale into account, scale should ALWAYS contain a .)
-            if self._scale is not None:
-                digits = max(0, str(self._scale)[::-1].find("."))
-                value = round(value * float(self._scale), digits)
-                # If scale is a str, format the value with the same precision
-                if isinstance(self._scale, str):
-                    value = "{:.{precision}f}".format(value, precision=digits)
-
-            # Value conversion function
-            if self._value_fn:
-                value = self._value_fn(value)
+                value = self._decode(raw)
+                self._cached_raw = raw.tobytes()
+                self._cached_value = value
 
             # Custom native value implementation
             value = self._custom_native_value(value)
 
         except Exception as e:
             LOGGER.error(
-                f"Unable to get native value for entity: {self.entity_id or self.name}",
+                "Unable to get native value for entity %s: %s",
+                self.entity_id or self.name,
                 e,
             )
             return None
 
-        if self.entity_id:
-            LOGGER.debug(
-                f"Entity: {self.entity_id}, value: {value}{' ' + self.unit_of_measurement if self.unit_of_measurement else ''}"
-            )
-        else:
-            # Used for internal entities (no entity_id)
-            LOGGER.debug(f"-> Internal entity: {self.name}, value: {value}")
+        # Skip the logging (and its property lookups) when debug logging is disabled
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            if self.entity_id:
+                LOGGER.debug(
+                    "Entity: %s, value: %s%s",
+                    self.entity_id,
+                    value,
+                    self._log_unit_suffix,
+                )
+            else:
+                # Used for internal entities (no entity_id)
+                LOGGER.debug("-> Internal entity: %s, value: %s", self.name, value)
 
         return value
 
-    @property
-    @abstractmethod
-    def _entity_type(self) -> str:
-        pass
+
+# Index of entity descriptions by key, per tuple of entity descriptions (keyed by id, the tuple is kept to keep the id valid)
+_DESCRIPTION_INDEXES: dict[
+    int, tuple[tuple[EntityDescription, ...], dict[str, EntityDescription]]
+] = {}
 
 
 def get_entity_description(
-    descriptions: tuple[EntityDescription], key: str
-) -> EntityDescription | None:
+    descriptions: tuple[EntityDescription, ...], key: str
+) -> EntityDescription:
     """Get an entity description by its 'key' from a tuple of entity descriptions."""
-    description = next(
-        (d for d in descriptions if d.key == key),
-        None,
-    )
+    index = _DESCRIPTION_INDEXES.get(id(descriptions))
+    if index is None:
+        index = (descriptions, {d.key: d for d in descriptions})
+        _DESCRIPTION_INDEXES[id(descriptions)] = index
+    description = index[1].get(key)
     if description is None:
         raise ValueError(f"Invalid entity description key: {key}")
     return description
@@ -121,25 +121,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up the number entities based on a config entry."""
     # Only set up number entities when config data coordinator is enabled
-    coordinator_config_data = entry.runtime_data.coordinator_config_data
-    if not coordinator_config_data:
+    if not (coordinator_config_data := entry.runtime_data.coordinator_config_data):
         return
 
-    entities: list[SajH1MqttEntity] = []
-
     # Add all number entities
-    for description in NUMBER_ENTITY_DESCRIPTIONS:
-        entity = SajH1MqttNumberEntity(coordinator_config_data, description)
-        entities.append(entity)
+    entities: list[SajH1MqttEntity] = [
+        SajH1MqttNumberEntity(coordinator_config_data, description)
+        for description in NUMBER_ENTITY_DESCRIPTIONS
+    ]
 
     # Add the entities
-    LOGGER.info(f"Setting up {len(entities)} number entities")
+    LOGGER.info("Setting up %d number entities", len(entities))
     async_add_entities(entities)
 
 
 class SajH1MqttNumberEntity(SajH1MqttEntity, NumberEntity):
     """SAJ H1 MQTT number entity."""
 
+    _entity_type = "number"
+
     def __init__(
         self,
         coordinator: SajH1MqttDataCoordinator,
@@ -150,10 +150,9 @@ class SajH1MqttNumberEntity(SajH1MqttEntity, NumberEntity):
 
         # Custom fields from entity description
         self._modbus_register = description.modbus_register
-
-    @property
-    def _entity_type(self) -> str:
-        return "number"
+        self._write_register = coordinator.async_write_register
+        self._min_value = description.native_min_value
+        self._max_value = description.native_max_value
 
     @property
     def native_value(self) -> float | None:
@@ -162,13 +161,13 @@ class SajH1MqttNumberEntity(SajH1MqttEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
+        # Validate the value before sending anything to the inverter
+        if not self._min_value <= value <= self._max_value:
+            raise ValueError(f"Invalid value: {value}")
         try:
             modbus_value = int(value)  # modbus register value must be int
         except Exception as err:
             raise ValueError(f"Invalid value: {value}") from err
 
-        # Write register and refresh coordinator
-        await self.coordinator.mqtt_client.write_register(
-            self._modbus_register, modbus_value
-        )
-        await self.coordinator.async_request_refresh()
+        # Queue register write (coordinator data is updated after the queued writes)
+        await self._write_register(self._modbus_register, modbus_value)
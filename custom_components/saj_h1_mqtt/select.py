@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Final
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.const import EntityCategory
@@ -17,12 +18,9 @@ from .entity import SajH1MqttEntity, SajH1MqttEntityDescription
 from .types import SajH1MqttConfigEntry
 
 
-async def _modbus_write_and_refresh_coordinator(
-    coordinator: SajH1MqttDataCoordinator, modbus_register: int, modbus_value: int
-) -> None:
-    # Write modbus register and refresh coordinator
-    await coordinator.mqtt_client.write_register(modbus_register, modbus_value)
-    await coordinator.async_request_refresh()
+# App mode lookups between register values and option names
+_APP_MODE_NAMES: Final = {mode.value: mode.name for mode in AppMode}
+_APP_MODE_VALUES: Final = {mode.name: mode.value for mode in AppMode}
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -40,13 +38,13 @@ SELECT_ENTITY_DESCRIPTIONS: tuple[SajH1MqttSelectEntityDescription, ...] = (
         key="app_mode",
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=True,
-        options=[x.name for x in AppMode],
+        options=list(_APP_MODE_VALUES),
         modbus_register_offset=0,
         modbus_register_data_type=">H",
         modbus_register_scale=None,
-        value_fn=lambda x: AppMode(x).name,
+        value_fn=_APP_MODE_NAMES.get,
         modbus_register=MODBUS_REG_APP_MODE,
-        modbus_value_fn=lambda x: AppMode[x].value,
+        modbus_value_fn=_APP_MODE_VALUES.__getitem__,
     ),
 )
 
@@ -58,19 +56,17 @@ async def async_setup_entry(
 ) -> None:
     """Set up the select entities based on a config entry."""
     # Only set up select entities when config data coordinator is enabled
-    coordinator_config_data = entry.runtime_data.coordinator_config_data
-    if not coordinator_config_data:
+    if not (coordinator_config_data := entry.runtime_data.coordinator_config_data):
         return
 
-    entities: list[SajH1MqttEntity] = []
-
-    # Add all number entities
-    for description in SELECT_ENTITY_DESCRIPTIONS:
-        entity = SajH1MqttSelectEntity(coordinator_config_data, description)
-        entities.append(entity)
+    # Add all select entities
+    entities: list[SajH1MqttEntity] = [
+        SajH1MqttSelectEntity(coordinator_config_data, description)
+        for description in SELECT_ENTITY_DESCRIPTIONS
+    ]
 
     # Add the entities
-    LOGGER.info(f"Setting up {len(entities)} select entities")
+    LOGGER.info("Setting up %d select entities", len(entities))
     async_add_entities(entities)
 
 
@@ -80,6 +76,8 @@ class SajH1MqttSelectEntity(SajH1MqttEntity, SelectEntity, ABC):
     This is the base abstract class for all select entity classes.
     """
 
+    _entity_type = "select"
+
     def __init__(
         self,
         coordinator: SajH1MqttDataCoordinator,
@@ -89,27 +87,25 @@ class SajH1MqttSelectEntity(SajH1MqttEntity, SelectEntity, ABC):
         super().__init__(coordinator, description)
         # Custom fields from entity description
         self._modbus_register = description.modbus_register
+        self._write_register = coordinator.async_write_register
         self._modbus_value_fn = description.modbus_value_fn
-
-    @property
-    def _entity_type(self) -> str:
-        return "select"
+        self._valid_options = frozenset(description.options)
 
     @property
     def current_option(self) -> str | None:
         """Return the selected entity option to represent the entity state."""
         value = self._get_native_value()
-        return str(value) if value else None
+        return None if value is None else str(value)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
+        # Validate the option before sending anything to the inverter
+        if option not in self._valid_options:
+            raise ValueError(f"Invalid option: {option}")
         try:
             modbus_value = self._modbus_value_fn(option)
         except Exception as err:
             raise ValueError(f"Invalid option: {option}") from err
 
-        # Write modbus register and refresh coordinator
-        await self.coordinator.mqtt_client.write_register(
-            self._modbus_register, modbus_value
-        )
-        await self.coordinator.async_request_refresh()
+        # Queue register write (coordinator data is updated after the queued writes)
+        await self._write_register(self._modbus_register, modbus_value)
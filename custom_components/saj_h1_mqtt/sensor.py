@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from datetime import datetime
-from zoneinfo import ZoneInfo
+import logging
+from struct import Struct
+from typing import Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -24,6 +27,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_ENABLE_ACCURATE_REALTIME_POWER_DATA,
@@ -36,7 +40,12 @@ from .const import (
     WorkingMode,
 )
 from .coordinator import SajH1MqttDataCoordinator
-from .entity import SajH1MqttEntity, SajH1MqttEntityDescription, get_entity_description
+from .entity import (
+    SajH1MqttEntity,
+    SajH1MqttEntityDescription,
+    build_decoder,
+    get_entity_description,
+)
 from .types import SajH1MqttConfigEntry
 
 
@@ -47,6 +56,29 @@ class SajH1MqttSensorEntityDescription(
     """A class that describes SAJ H1 MQTT number entities."""
 
 
+# Working mode and app mode names by register value
+_WORKING_MODE_NAMES: Final = {mode.value: mode.name for mode in WorkingMode}
+_APP_MODE_NAMES: Final = {mode.value: mode.name for mode in AppMode}
+
+# State lookup tables for the realtime state sensors
+# Indexed by 'x > 0' (2 states) or by the sign of x + 1 (3 states)
+_PV_STATES: Final = (PVState.STANDBY.value, PVState.PRODUCING.value)
+_BATTERY_STATES: Final = (
+    BatteryState.CHARGING.value,
+    BatteryState.STANDBY.value,
+    BatteryState.DISCHARGING.value,
+)
+_GRID_STATES: Final = (
+    GridState.EXPORTING.value,
+    GridState.STANDBY.value,
+    GridState.IMPORTING.value,
+)
+_SYSTEM_LOAD_STATES: Final = (
+    SystemLoadState.STANDBY.value,
+    SystemLoadState.CONSUMING.value,
+)
+
+
 # fmt: off
 
 # realtime data sensors
@@ -61,7 +93,7 @@ SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS: tuple[SajH1MqttSensorEntityDescription, .
     SajH1MqttSensorEntityDescription(key="time_reserved", entity_registry_enabled_default=False, device_class=None, state_class=None, native_unit_of_measurement=None, modbus_register_offset=7, modbus_register_data_type=">B", modbus_register_scale=None, value_fn=None),
 
     # General data
-    SajH1MqttSensorEntityDescription(key="inverter_working_mode", entity_registry_enabled_default=True, device_class=None, state_class=None, native_unit_of_measurement=None, modbus_register_offset=0x8, modbus_register_data_type=">H", modbus_register_scale=None, value_fn=lambda x: WorkingMode(x).name),
+    SajH1MqttSensorEntityDescription(key="inverter_working_mode", entity_registry_enabled_default=True, device_class=None, state_class=None, native_unit_of_measurement=None, modbus_register_offset=0x8, modbus_register_data_type=">H", modbus_register_scale=None, value_fn=_WORKING_MODE_NAMES.get),
     SajH1MqttSensorEntityDescription(key="heatsink_temperature", entity_registry_enabled_default=True, device_class=SensorDeviceClass.TEMPERATURE, state_class=SensorStateClass.MEASUREMENT, native_unit_of_measurement=UnitOfTemperature.CELSIUS, modbus_register_offset=0x20, modbus_register_data_type=">h", modbus_register_scale=0.1, value_fn=None),
     SajH1MqttSensorEntityDescription(key="earth_leakage_current", entity_registry_enabled_default=True, device_class=SensorDeviceClass.CURRENT, state_class=SensorStateClass.MEASUREMENT, native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE, modbus_register_offset=0x24, modbus_register_data_type=">H", modbus_register_scale=1.0, value_fn=None),
 
@@ -132,6 +164,19 @@ SAJ_REALTIME_DATA_ENERGY_STATS_SENSOR_DESCRIPTIONS: tuple[SajH1MqttSensorEntityD
 
 # fmt: on
 
+# realtime data energy statistics sensors for every period (4 statistics for each type)
+SAJ_REALTIME_DATA_ENERGY_STATS_PERIOD_SENSOR_DESCRIPTIONS: tuple[
+    SajH1MqttSensorEntityDescription, ...
+] = tuple(
+    replace(
+        description,
+        key=f"{description.key}_{period}",
+        modbus_register_offset=description.modbus_register_offset + 4 * index,
+    )
+    for description in SAJ_REALTIME_DATA_ENERGY_STATS_SENSOR_DESCRIPTIONS
+    for index, period in enumerate(("daily", "monthly", "yearly", "total"))
+)
+
 # Realtime power sensors (based on realtime data, to be used with power flow charts)
 REALTIME_PV_POWER_SENSOR_DESCRIPTION = SajH1MqttSensorEntityDescription(
     key="realtime_pv_power",
@@ -188,9 +233,7 @@ REALTIME_PV_STATE_SENSOR_DESCRIPTION = SajH1MqttSensorEntityDescription(
     modbus_register_offset=0x14A,
     modbus_register_data_type=">H",
     modbus_register_scale=1.0,
-    value_fn=lambda x: None
-    if x is None
-    else (PVState.PRODUCING.value if x > 0 else PVState.STANDBY.value),
+    value_fn=lambda x: None if x is None else _PV_STATES[x > 0],
 )
 REALTIME_BATTERY_STATE_SENSOR_DESCRIPTION = SajH1MqttSensorEntityDescription(
     key="realtime_battery_state",
@@ -201,13 +244,7 @@ REALTIME_BATTERY_STATE_SENSOR_DESCRIPTION = SajH1MqttSensorEntityDescription(
     modbus_register_offset=0x14C,
     modbus_register_data_type=">h",
     modbus_register_scale=1.0,
-    value_fn=lambda x: None
-    if x is None
-    else (
-        BatteryState.DISCHARGING.value
-        if x > 0
-        else (BatteryState.CHARGING.value if x < 0 else BatteryState.STANDBY.value)
-    ),
+    value_fn=lambda x: None if x is None else _BATTERY_STATES[(x > 0) - (x < 0) + 1],
 )
 REALTIME_GRID_STATE_SENSOR_DESCRIPTION = SajH1MqttSensorEntityDescription(
     key="realtime_grid_state",
@@ -218,13 +255,7 @@ REALTIME_GRID_STATE_SENSOR_DESCRIPTION = SajH1MqttSensorEntityDescription(
     modbus_register_offset=0x15A,  # use summary_smart_meter_load_power_2 data
     modbus_register_data_type=">h",
     modbus_register_scale=-1.0,  # use inverted scale as value is inverted
-    value_fn=lambda x: None
-    if x is None
-    else (
-        GridState.IMPORTING.value
-        if x > 0
-        else (GridState.EXPORTING.value if x < 0 else GridState.STANDBY.value)
-    ),
+    value_fn=lambda x: None if x is None else _GRID_STATES[(x > 0) - (x < 0) + 1],
 )
 REALTIME_SYSTEM_LOAD_STATE_SENSOR_DESCRIPTION = SajH1MqttSensorEntityDescription(
     key="realtime_system_load_state",
@@ -235,9 +266,7 @@ REALTIME_SYSTEM_LOAD_STATE_SENSOR_DESCRIPTION = SajH1MqttSensorEntityDescription
     modbus_register_offset=0x140,
     modbus_register_data_type=">H",
     modbus_register_scale=1.0,
-    value_fn=lambda x: None
-    if x is None
-    else (SystemLoadState.CONSUMING.value if x > 0 else GridState.STANDBY.value),
+    value_fn=lambda x: None if x is None else _SYSTEM_LOAD_STATES[x > 0],
 )
 
 # Accurate realtime sensors (only used when enabled in config, replaces the original 'realtime_grid_power' and 'realtime_grid_state' sensors)
@@ -279,13 +308,7 @@ ACCURATE_REALTIME_GRID_STATE_SENSOR_DESCRIPTION = SajH1MqttSensorEntityDescripti
     modbus_register_offset=0x142,  # use summary_smart_meter_load_power_1 data
     modbus_register_data_type=">h",
     modbus_register_scale=1.0,
-    value_fn=lambda x: None
-    if x is None
-    else (
-        GridState.IMPORTING.value
-        if x > 0
-        else (GridState.EXPORTING.value if x < 0 else GridState.STANDBY.value)
-    ),
+    value_fn=lambda x: None if x is None else _GRID_STATES[(x > 0) - (x < 0) + 1],
 )
 
 # Inverter time sensor
@@ -295,10 +318,10 @@ INVERTER_TIME_SENSOR_DESCRIPTION = SajH1MqttSensorEntityDescription(
     device_class=SensorDeviceClass.TIMESTAMP,
     state_class=None,
     native_unit_of_measurement=None,
-    modbus_register_offset=None,
-    modbus_register_data_type=None,
+    modbus_register_offset=0,  # use time_year to time_second data
+    modbus_register_data_type=">HBBBBB",
     modbus_register_scale=None,
-    value_fn=lambda x: None,
+    value_fn=None,
 )
 
 # fmt: off
@@ -388,7 +411,7 @@ SAJ_BATTERY_CONTROLLER_DATA_SENSOR_DESCRIPTIONS: tuple[SajH1MqttSensorEntityDesc
 
 # config data sensors
 SAJ_CONFIG_DATA_SENSOR_DESCRIPTIONS: tuple[SajH1MqttSensorEntityDescription, ...] = (
-    SajH1MqttSensorEntityDescription(key="app_mode", entity_registry_enabled_default=True, device_class=None, state_class=None, native_unit_of_measurement=None, modbus_register_offset=0, modbus_register_data_type=">H", modbus_register_scale=None, value_fn=lambda x: AppMode(x).name),
+    SajH1MqttSensorEntityDescription(key="app_mode", entity_registry_enabled_default=True, device_class=None, state_class=None, native_unit_of_measurement=None, modbus_register_offset=0, modbus_register_data_type=">H", modbus_register_scale=None, value_fn=_APP_MODE_NAMES.get),
     SajH1MqttSensorEntityDescription(key="grid_charge_power_limit", entity_registry_enabled_default=True, device_class=SensorDeviceClass.POWER, state_class=SensorStateClass.MEASUREMENT, native_unit_of_measurement=UnitOfPower.WATT, modbus_register_offset=2, modbus_register_data_type=">H", modbus_register_scale=None, value_fn=None),
     SajH1MqttSensorEntityDescription(key="grid_feed_power_limit", entity_registry_enabled_default=True, device_class=SensorDeviceClass.POWER, state_class=SensorStateClass.MEASUREMENT, native_unit_of_measurement=UnitOfPower.WATT, modbus_register_offset=4, modbus_register_data_type=">H", modbus_register_scale=None, value_fn=None),
     SajH1MqttSensorEntityDescription(key="battery_soc_backup", entity_registry_enabled_default=True, device_class=SensorDeviceClass.BATTERY, state_class=SensorStateClass.MEASUREMENT, native_unit_of_measurement=PERCENTAGE, modbus_register_offset=84, modbus_register_data_type=">H", modbus_register_scale=None, value_fn=None),
@@ -405,8 +428,6 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor entities based on a config entry."""
-    entities: list[SajH1MqttSensorEntity] = []
-
     # Check if we want to use the accurate power sensors or not
     use_accurate_realtime_power_data = entry.options.get(
         CONF_ENABLE_ACCURATE_REALTIME_POWER_DATA, False
@@ -421,158 +442,95 @@ async def async_setup_entry(
     )
     coordinator_config_data = entry.runtime_data.coordinator_config_data
 
-    # Realtime data sensors
-    for description in SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS:
-        entity = SajH1MqttSensorEntity(coordinator_realtime_data, description)
-        entities.append(entity)
-
-    # Realtime data energy statistics sensors
-    for description in SAJ_REALTIME_DATA_ENERGY_STATS_SENSOR_DESCRIPTIONS:
-        # 4 statistics for each type
-        stats_offset = description.modbus_register_offset
-        for period in "daily", "monthly", "yearly", "total":
-            # Create new statistics sensor entity description for every period
-            stats_description = SajH1MqttSensorEntityDescription(
-                key=f"{description.key}_{period}",
-                entity_registry_enabled_default=description.entity_registry_enabled_default,
-                device_class=description.device_class,
-                state_class=description.state_class,
-                native_unit_of_measurement=description.native_unit_of_measurement,
-                modbus_register_offset=stats_offset,
-                modbus_register_data_type=description.modbus_register_data_type,
-                modbus_register_scale=description.modbus_register_scale,
-                value_fn=description.value_fn,
-            )
-            entity = SajH1MqttSensorEntity(coordinator_realtime_data, stats_description)
-            entities.append(entity)
-            # Update offset for next period
-            stats_offset += 4
-
-    # Realtime power sensors
-
-    # Realtime pv power sensor
-    entity = SajH1MqttSensorEntity(
-        coordinator_realtime_data, REALTIME_PV_POWER_SENSOR_DESCRIPTION
+    # Realtime power and state sensors (use default or accurate power data for grid and system load)
+    realtime_power_and_state_descriptions = (
+        REALTIME_PV_POWER_SENSOR_DESCRIPTION,
+        REALTIME_BATTERY_POWER_SENSOR_DESCRIPTION,
+        ACCURATE_REALTIME_GRID_POWER_SENSOR_DESCRIPTION
+        if use_accurate_realtime_power_data
+        else REALTIME_GRID_POWER_SENSOR_DESCRIPTION,
+        REALTIME_PV_STATE_SENSOR_DESCRIPTION,
+        REALTIME_BATTERY_STATE_SENSOR_DESCRIPTION,
+        ACCURATE_REALTIME_GRID_STATE_SENSOR_DESCRIPTION
+        if use_accurate_realtime_power_data
+        else REALTIME_GRID_STATE_SENSOR_DESCRIPTION,
+        REALTIME_SYSTEM_LOAD_STATE_SENSOR_DESCRIPTION,
     )
-    entities.append(entity)
 
-    # Realtime battery power sensor
-    entity = SajH1MqttSensorEntity(
-        coordinator_realtime_data, REALTIME_BATTERY_POWER_SENSOR_DESCRIPTION
+    # Sensors per coordinator (skip the optional coordinators that are not enabled)
+    sensor_groups: tuple[
+        tuple[
+            SajH1MqttDataCoordinator | None,
+            tuple[SajH1MqttSensorEntityDescription, ...],
+        ],
+        ...,
+    ] = (
+        (coordinator_realtime_data, SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS),
+        (
+            coordinator_realtime_data,
+            SAJ_REALTIME_DATA_ENERGY_STATS_PERIOD_SENSOR_DESCRIPTIONS,
+        ),
+        (coordinator_realtime_data, realtime_power_and_state_descriptions),
+        (coordinator_inverter_data, SAJ_INVERTER_DATA_SENSOR_DESCRIPTIONS),
+        (coordinator_battery_data, SAJ_BATTERY_DATA_SENSOR_DESCRIPTIONS),
+        (
+            coordinator_battery_controller_data,
+            SAJ_BATTERY_CONTROLLER_DATA_SENSOR_DESCRIPTIONS,
+        ),
+        (coordinator_config_data, SAJ_CONFIG_DATA_SENSOR_DESCRIPTIONS),
     )
-    entities.append(entity)
-
-    # Realtime grid power sensor (use default or accurate power data)
-    description = REALTIME_GRID_POWER_SENSOR_DESCRIPTION
-    if use_accurate_realtime_power_data:
-        description = ACCURATE_REALTIME_GRID_POWER_SENSOR_DESCRIPTION
-    entity = SajH1MqttSensorEntity(coordinator_realtime_data, description)
-    entities.append(entity)
+    entities: list[SajH1MqttSensorEntity] = [
+        SajH1MqttSensorEntity(coordinator, description)
+        for coordinator, descriptions in sensor_groups
+        if coordinator
+        for description in descriptions
+    ]
 
     # Realtime system load power sensor (use default or accurate power data)
     if use_accurate_realtime_power_data:
         # Accurate power data must be calculated from different sensors
-        entity = SajH1MqttRealtimeSystemLoadPowerSensorEntity(
-            coordinator_realtime_data,
-            ACCURATE_REALTIME_SYSTEM_LOAD_POWER_SENSOR_DESCRIPTION,
-            get_entity_description(
-                SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS, "summary_system_load_power"
-            ),
-            get_entity_description(
-                SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS,
-                "summary_smart_meter_load_power_1",
-            ),
-            get_entity_description(
-                SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS,
-                "summary_smart_meter_load_power_2",
-            ),
+        entities.append(
+            SajH1MqttRealtimeSystemLoadPowerSensorEntity(
+                coordinator_realtime_data,
+                ACCURATE_REALTIME_SYSTEM_LOAD_POWER_SENSOR_DESCRIPTION,
+                get_entity_description(
+                    SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS, "summary_system_load_power"
+                ),
+                get_entity_description(
+                    SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS,
+                    "summary_smart_meter_load_power_1",
+                ),
+                get_entity_description(
+                    SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS,
+                    "summary_smart_meter_load_power_2",
+                ),
+            )
         )
-        entities.append(entity)
     else:
-        entity = SajH1MqttSensorEntity(
-            coordinator_realtime_data, REALTIME_SYSTEM_LOAD_POWER_SENSOR_DESCRIPTION
+        entities.append(
+            SajH1MqttSensorEntity(
+                coordinator_realtime_data, REALTIME_SYSTEM_LOAD_POWER_SENSOR_DESCRIPTION
+            )
         )
-        entities.append(entity)
-
-    # Custom state sensors (based on realtime data)
-
-    # PV state sensor
-    entity = SajH1MqttSensorEntity(
-        coordinator_realtime_data, REALTIME_PV_STATE_SENSOR_DESCRIPTION
-    )
-    entities.append(entity)
-
-    # Battery state sensor
-    entity = SajH1MqttSensorEntity(
-        coordinator_realtime_data, REALTIME_BATTERY_STATE_SENSOR_DESCRIPTION
-    )
-    entities.append(entity)
-
-    # Grid state sensor (use default or accurate power data)
-    description = REALTIME_GRID_STATE_SENSOR_DESCRIPTION
-    if use_accurate_realtime_power_data:
-        description = ACCURATE_REALTIME_GRID_STATE_SENSOR_DESCRIPTION
-    entity = SajH1MqttSensorEntity(coordinator_realtime_data, description)
-    entities.append(entity)
-
-    # System load state sensor
-    entity = SajH1MqttSensorEntity(
-        coordinator_realtime_data, REALTIME_SYSTEM_LOAD_STATE_SENSOR_DESCRIPTION
-    )
-    entities.append(entity)
 
     # Inverter time sensor (based on multiple realtime data registers)
-    entity = SajH1MqttInverterTimeSensorEntity(
-        coordinator_realtime_data,
-        INVERTER_TIME_SENSOR_DESCRIPTION,
-        get_entity_description(SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS, "time_year"),
-        get_entity_description(SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS, "time_month"),
-        get_entity_description(SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS, "time_day"),
-        get_entity_description(SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS, "time_hour"),
-        get_entity_description(SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS, "time_minute"),
-        get_entity_description(SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS, "time_second"),
-        get_entity_description(SAJ_REALTIME_DATA_SENSOR_DESCRIPTIONS, "time_reserved"),
-        hass.config.time_zone,  # Time zone for constructing time with correct time zone
+    entities.append(
+        SajH1MqttInverterTimeSensorEntity(
+            coordinator_realtime_data,
+            INVERTER_TIME_SENSOR_DESCRIPTION,
+            hass.config.time_zone,  # Time zone for constructing time with correct time zone
+        )
     )
-    entities.append(entity)
-
-    # Inverter data sensors
-    if coordinator_inverter_data:
-        for description in SAJ_INVERTER_DATA_SENSOR_DESCRIPTIONS:
-            entity = SajH1MqttSensorEntity(coordinator_inverter_data, description)
-            entities.append(entity)
-
-    # Battery data sensors
-    if coordinator_battery_data:
-        for description in SAJ_BATTERY_DATA_SENSOR_DESCRIPTIONS:
-            entity = SajH1MqttSensorEntity(coordinator_battery_data, description)
-            entities.append(entity)
-
-    # Battery controller data sensors
-    if coordinator_battery_controller_data:
-        for description in SAJ_BATTERY_CONTROLLER_DATA_SENSOR_DESCRIPTIONS:
-            entity = SajH1MqttSensorEntity(
-                coordinator_battery_controller_data, description
-            )
-            entities.append(entity)
-
-    # Config data sensors
-    if coordinator_config_data:
-        for description in SAJ_CONFIG_DATA_SENSOR_DESCRIPTIONS:
-            entity = SajH1MqttSensorEntity(coordinator_config_data, description)
-            entities.append(entity)
 
     # Add the entities
-    LOGGER.info(f"Setting up {len(entities)} sensor entities")
+    LOGGER.info("Setting up %d sensor entities", len(entities))
     async_add_entities(entities)
 
 
 class SajH1MqttSensorEntity(SajH1MqttEntity, SensorEntity):
     """SAJ H1 MQTT sensor entity."""
 
-    @property
-    def _entity_type(self) -> str:
-        return "sensor"
+    _entity_type = "sensor"
 
     @property
     def native_value(self) -> int | float | str | None:
@@ -583,7 +541,7 @@ class SajH1MqttSensorEntity(SajH1MqttEntity, SensorEntity):
 class SajH1MqttRealtimeSystemLoadPowerSensorEntity(SajH1MqttSensorEntity):
     """SAJ H1 MQTT realtime system load power sensor entity.
 
-    This custom sensor uses the value of 2 smart meter sensors to calculate the final value.
+    This custom sensor decodes the values of the system load and 2 smart meter sensors to calculate the final value.
     """
 
     def __init__(
@@ -596,24 +554,15 @@ class SajH1MqttRealtimeSystemLoadPowerSensorEntity(SajH1MqttSensorEntity):
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator, description)
-        self._system_load = SajH1MqttSensorEntity(coordinator, system_load)
-        self._smart_meter_1 = SajH1MqttSensorEntity(coordinator, smart_meter_1)
-        self._smart_meter_2 = SajH1MqttSensorEntity(coordinator, smart_meter_2)
-
-    def _get_system_load_power(self) -> int | float | str | None:
-        """Get the system load power sensor value."""
-        val = self._system_load.native_value
-        return val if val else 0.0
 
-    def _get_smart_meter_1_power(self) -> int | float | str | None:
-        """Get the smart meter 1 power sensor value."""
-        val = self._smart_meter_1.native_value
-        return val if val else 0.0
-
-    def _get_smart_meter_2_power(self) -> int | float | str | None:
-        """Get the smart meter 2 power sensor value."""
-        val = self._smart_meter_2.native_value
-        return val if val else 0.0
+        # Decoders and register slices of the summed sensors (decoded straight from the coordinator data)
+        self._power_decoders: list[
+            tuple[Callable[[memoryview], int | float | str | None], slice]
+        ] = []
+        for power_description in system_load, smart_meter_1, smart_meter_2:
+            decode, reg_length = build_decoder(power_description)
+            offset = power_description.modbus_register_offset
+            self._power_decoders.append((decode, slice(offset, offset + reg_length)))
 
     def _get_native_value(self) -> int | float | str | None:
         """Get the native value for the entity.
@@ -628,15 +577,25 @@ class SajH1MqttRealtimeSystemLoadPowerSensorEntity(SajH1MqttSensorEntity):
         if payload is None:
             return None
 
-        value = (
-            self._get_system_load_power()
-            + self._get_smart_meter_1_power()
-            + self._get_smart_meter_2_power()
-        )
+        try:
+            # A part without a value counts as 0.0
+            data_view = self.coordinator.data_view
+            value = sum(
+                decode(data_view[raw_slice]) or 0.0
+                for decode, raw_slice in self._power_decoders
+            )
+        except Exception as e:
+            LOGGER.error(
+                "Unable to get native value for entity %s: %s",
+                self.entity_id or self.name,
+                e,
+            )
+            return None
 
-        LOGGER.debug(
-            f"Entity: {self.entity_id}, value: {value}{' ' + self.unit_of_measurement if self.unit_of_measurement else ''}"
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Entity: %s, value: %s%s", self.entity_id, value, self._log_unit_suffix
+            )
 
         return value
 
@@ -644,58 +603,24 @@ class SajH1MqttRealtimeSystemLoadPowerSensorEntity(SajH1MqttSensorEntity):
 class SajH1MqttInverterTimeSensorEntity(SajH1MqttSensorEntity):
     """SAJ H1 MQTT inverter time sensor entity.
 
-    This custom sensor uses the values of different time registers to construct the time.
+    This custom sensor decodes the different time registers at once to construct the time.
     """
 
     def __init__(
         self,
         coordinator: SajH1MqttDataCoordinator,
         description: SajH1MqttEntityDescription,
-        year: SajH1MqttEntityDescription,
-        month: SajH1MqttEntityDescription,
-        day: SajH1MqttEntityDescription,
-        hour: SajH1MqttEntityDescription,
-        minute: SajH1MqttEntityDescription,
-        second: SajH1MqttEntityDescription,
-        reserved: SajH1MqttEntityDescription,
         time_zone: str | None,
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator, description)
-        self._year = SajH1MqttSensorEntity(coordinator, year)
-        self._month = SajH1MqttSensorEntity(coordinator, month)
-        self._day = SajH1MqttSensorEntity(coordinator, day)
-        self._hour = SajH1MqttSensorEntity(coordinator, hour)
-        self._minute = SajH1MqttSensorEntity(coordinator, minute)
-        self._second = SajH1MqttSensorEntity(coordinator, second)
-        self._reserved = SajH1MqttSensorEntity(coordinator, reserved)
-        self._zone_info = ZoneInfo(time_zone or "UTC")  # fallback to UTC
+        # Time zones are cached by hass (fallback to UTC)
+        zone_info = (time_zone and dt_util.get_time_zone(time_zone)) or dt_util.UTC
+        unpack_from = Struct(description.modbus_register_data_type).unpack_from
 
-    def _get_native_value(self) -> int | float | str | None:
-        """Get the native value for the entity.
+        def decode(raw: memoryview) -> datetime:
+            # Create timezone aware datetime from year, month, day, hour, minute and second
+            return datetime(*unpack_from(raw), tzinfo=zone_info)
 
-        The datetime is constructed from the different time registers.
-        """
-        # Return None if no coordinator data
-        payload = self.coordinator.data
-        if payload is None:
-            return None
-
-        # Get different time register values
-        yyyy = self._year.native_value
-        mm = self._month.native_value
-        dd = self._day.native_value
-        hh = self._hour.native_value
-        mi = self._minute.native_value
-        ss = self._second.native_value
-
-        # Create timezone aware datetime
-        value = None
-        if all(x is not None for x in [yyyy, mm, dd, hh, mi, ss]):
-            value = datetime(yyyy, mm, dd, hh, mi, ss, tzinfo=self._zone_info)
-
-        LOGGER.debug(
-            f"Entity: {self.entity_id}, value: {value}{' ' + self.unit_of_measurement if self.unit_of_measurement else ''}"
-        )
-
-        return value
+        # Replace the register decoder (unchanged time registers still reuse the last datetime)
+        self._decode = decode
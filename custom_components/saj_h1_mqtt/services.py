@@ -30,6 +30,30 @@ from .const import (
 )
 from .types import SajH1MqttConfigEntry
 
+# Service schemas (built once, shared by all config entries)
+_READ_REGISTER_SCHEMA = vol.Schema(
+    vol.All(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY): ConfigEntrySelector(),
+            vol.Required(ATTR_REGISTER): cv.string,
+            vol.Required(ATTR_REGISTER_SIZE): cv.string,
+            vol.Optional(ATTR_REGISTER_FORMAT, default=None): vol.Any(cv.string, None),
+        }
+    )
+)
+_WRITE_REGISTER_SCHEMA = vol.Schema(
+    vol.All(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY): ConfigEntrySelector(),
+            vol.Required(ATTR_REGISTER): cv.string,
+            vol.Required(ATTR_REGISTER_VALUE): cv.string,
+        }
+    )
+)
+_REFRESH_DATA_SCHEMA = vol.Schema(
+    vol.All({vol.Optional(ATTR_CONFIG_ENTRY): ConfigEntrySelector()})
+)
+
 
 def async_register_services(hass: HomeAssistant) -> None:
     """Register services for SAJ H1 MQTT integration."""
@@ -42,22 +66,8 @@ def async_register_services(hass: HomeAssistant) -> None:
         attr_register_size: str = call.data[ATTR_REGISTER_SIZE]
         attr_register_format: str | None = call.data[ATTR_REGISTER_FORMAT]
         # Validate input
-        try:
-            if attr_register.startswith("0x"):
-                register_start = int(attr_register, 16)
-            else:
-                register_start = int(attr_register)
-        except ValueError as e:
-            LOGGER.error(f"Invalid register: {attr_register}")
-            raise ServiceValidationError("Invalid register", DOMAIN) from e
-        try:
-            if attr_register_size.startswith("0x"):
-                register_size = int(attr_register_size, 16)
-            else:
-                register_size = int(attr_register_size)
-        except ValueError as e:
-            LOGGER.error(f"Invalid register size: {attr_register_size}")
-            raise ServiceValidationError("Invalid register value") from e
+        register_start = _parse_int("register", attr_register)
+        register_size = _parse_int("register size", attr_register_size)
         if attr_register_format and not attr_register_format.startswith(">"):
             msg = f"Invalid register format: {attr_register_format}"
             LOGGER.error(msg)
@@ -68,26 +78,15 @@ def async_register_services(hass: HomeAssistant) -> None:
         if attr_register_format:
             (result,) = unpack_from(attr_register_format, content, 0)
             return {"value": str(result)}
-        return {"value": ":".join(f"{b:02x}" for b in content)}
+        return {"value": content.hex(":")}
 
     if not hass.services.has_service(DOMAIN, SERVICE_READ_REGISTER):
-        LOGGER.debug(f"Registering service: {SERVICE_READ_REGISTER}")
+        LOGGER.debug("Registering service: %s", SERVICE_READ_REGISTER)
         hass.services.async_register(
             DOMAIN,
             SERVICE_READ_REGISTER,
             read_register,
-            schema=vol.Schema(
-                vol.All(
-                    {
-                        vol.Optional(ATTR_CONFIG_ENTRY): ConfigEntrySelector(),
-                        vol.Required(ATTR_REGISTER): cv.string,
-                        vol.Required(ATTR_REGISTER_SIZE): cv.string,
-                        vol.Optional(ATTR_REGISTER_FORMAT, default=None): vol.Any(
-                            cv.string, None
-                        ),
-                    }
-                )
-            ),
+            schema=_READ_REGISTER_SCHEMA,
             supports_response=SupportsResponse.ONLY,
         )
 
@@ -98,40 +97,18 @@ def async_register_services(hass: HomeAssistant) -> None:
         attr_register: str = call.data[ATTR_REGISTER]
         attr_register_value: str = call.data[ATTR_REGISTER_VALUE]
         # Validate input
-        try:
-            if attr_register.startswith("0x"):
-                register = int(attr_register, 16)
-            else:
-                register = int(attr_register)
-        except ValueError as e:
-            LOGGER.error(f"Invalid register: {attr_register}")
-            raise ServiceValidationError("Invalid register") from e
-        try:
-            if attr_register_value.startswith("0x"):
-                value = int(attr_register_value, 16)
-            else:
-                value = int(attr_register_value)
-        except ValueError as e:
-            LOGGER.error(f"Invalid register value: {attr_register_value}")
-            raise ServiceValidationError("Invalid register value") from e
+        register = _parse_int("register", attr_register)
+        value = _parse_int("register value", attr_register_value)
         # Write register
         await mqtt_client.write_register(register, value)
 
     if not hass.services.has_service(DOMAIN, SERVICE_WRITE_REGISTER):
-        LOGGER.debug(f"Registering service: {SERVICE_WRITE_REGISTER}")
+        LOGGER.debug("Registering service: %s", SERVICE_WRITE_REGISTER)
         hass.services.async_register(
             DOMAIN,
             SERVICE_WRITE_REGISTER,
             write_register,
-            schema=vol.Schema(
-                vol.All(
-                    {
-                        vol.Optional(ATTR_CONFIG_ENTRY): ConfigEntrySelector(),
-                        vol.Required(ATTR_REGISTER): cv.string,
-                        vol.Required(ATTR_REGISTER_VALUE): cv.string,
-                    }
-                )
-            ),
+            schema=_WRITE_REGISTER_SCHEMA,
         )
 
     async def refresh_inverter_data(call: ServiceCall) -> None:
@@ -140,17 +117,15 @@ def async_register_services(hass: HomeAssistant) -> None:
         coordinator = entry.runtime_data.coordinator_inverter_data
         if coordinator:
             LOGGER.debug("Refreshing inverter data")
-            await coordinator.async_request_refresh()
+            await coordinator.async_request_forced_refresh()
 
     if not hass.services.has_service(DOMAIN, SERVICE_REFRESH_INVERTER_DATA):
-        LOGGER.debug(f"Registering service: {SERVICE_REFRESH_INVERTER_DATA}")
+        LOGGER.debug("Registering service: %s", SERVICE_REFRESH_INVERTER_DATA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_REFRESH_INVERTER_DATA,
             refresh_inverter_data,
-            schema=vol.Schema(
-                vol.All({vol.Optional(ATTR_CONFIG_ENTRY): ConfigEntrySelector()})
-            ),
+            schema=_REFRESH_DATA_SCHEMA,
         )
 
     async def refresh_battery_data(call: ServiceCall) -> None:
@@ -159,17 +134,15 @@ def async_register_services(hass: HomeAssistant) -> None:
         coordinator = entry.runtime_data.coordinator_battery_data
         if coordinator:
             LOGGER.debug("Refreshing battery data")
-            await coordinator.async_request_refresh()
+            await coordinator.async_request_forced_refresh()
 
     if not hass.services.has_service(DOMAIN, SERVICE_REFRESH_BATTERY_DATA):
-        LOGGER.debug(f"Registering service: {SERVICE_REFRESH_BATTERY_DATA}")
+        LOGGER.debug("Registering service: %s", SERVICE_REFRESH_BATTERY_DATA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_REFRESH_BATTERY_DATA,
             refresh_battery_data,
-            schema=vol.Schema(
-                vol.All({vol.Optional(ATTR_CONFIG_ENTRY): ConfigEntrySelector()})
-            ),
+            schema=_REFRESH_DATA_SCHEMA,
         )
 
     async def refresh_battery_controller_data(call: ServiceCall) -> None:
@@ -178,17 +151,15 @@ def async_register_services(hass: HomeAssistant) -> None:
         coordinator = entry.runtime_data.coordinator_battery_controller_data
         if coordinator:
             LOGGER.debug("Refreshing battery controller data")
-            await coordinator.async_request_refresh()
+            await coordinator.async_request_forced_refresh()
 
     if not hass.services.has_service(DOMAIN, SERVICE_REFRESH_BATTERY_CONTROLLER_DATA):
-        LOGGER.debug(f"Registering service: {SERVICE_REFRESH_BATTERY_CONTROLLER_DATA}")
+        LOGGER.debug("Registering service: %s", SERVICE_REFRESH_BATTERY_CONTROLLER_DATA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_REFRESH_BATTERY_CONTROLLER_DATA,
             refresh_battery_controller_data,
-            schema=vol.Schema(
-                vol.All({vol.Optional(ATTR_CONFIG_ENTRY): ConfigEntrySelector()})
-            ),
+            schema=_REFRESH_DATA_SCHEMA,
         )
 
     async def refresh_config_data(call: ServiceCall) -> None:
@@ -197,28 +168,30 @@ def async_register_services(hass: HomeAssistant) -> None:
         coordinator = entry.runtime_data.coordinator_config_data
         if coordinator:
             LOGGER.debug("Refreshing config data")
-            await coordinator.async_request_refresh()
+            await coordinator.async_request_forced_refresh()
 
     if not hass.services.has_service(DOMAIN, SERVICE_REFRESH_CONFIG_DATA):
-        LOGGER.debug(f"Registering service: {SERVICE_REFRESH_CONFIG_DATA}")
+        LOGGER.debug("Registering service: %s", SERVICE_REFRESH_CONFIG_DATA)
         hass.services.async_register(
             DOMAIN,
             SERVICE_REFRESH_CONFIG_DATA,
             refresh_config_data,
-            schema=vol.Schema(
-                vol.All({vol.Optional(ATTR_CONFIG_ENTRY): ConfigEntrySelector()})
-            ),
+            schema=_REFRESH_DATA_SCHEMA,
         )
 
 
-def async_remove_services(hass: HomeAssistant) -> None:
-    """Remove all services."""
-    hass.services.async_remove(DOMAIN, SERVICE_READ_REGISTER)
-    hass.services.async_remove(DOMAIN, SERVICE_WRITE_REGISTER)
-    hass.services.async_remove(DOMAIN, SERVICE_REFRESH_INVERTER_DATA)
-    hass.services.async_remove(DOMAIN, SERVICE_REFRESH_BATTERY_DATA)
-    hass.services.async_remove(DOMAIN, SERVICE_REFRESH_BATTERY_CONTROLLER_DATA)
-    hass.services.async_remove(DOMAIN, SERVICE_REFRESH_CONFIG_DATA)
+def _parse_int(name: str, value: str) -> int:
+    """Parse an integer service input (decimal or prefixed, like 0x for hexadecimal)."""
+    try:
+        # Plain decimals first, int(value, 0) rejects zero-padded decimals like 010
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return int(value, 0)
+    except ValueError as e:
+        LOGGER.error("Invalid %s: %s", name, value)
+        raise ServiceValidationError(f"Invalid {name}") from e
 
 
 def _get_config_entry(
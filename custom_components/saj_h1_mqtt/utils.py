@@ -1,6 +1,6 @@
 """Utility functions for the SAJ H1 MQTT integration."""
 
-from .const import LOGGER
+from typing import Final
 
 
 def log_hex(value: int) -> str:
@@ -8,13 +8,26 @@ def log_hex(value: int) -> str:
     return f"{hex(value)} ({value})"
 
 
-def debug(msg: str, enabled: bool = True) -> None:
-    """Debug log helper to decide if it shoud be logged or not."""
-    if enabled:
-        LOGGER.debug(msg)
+def _build_crc16_table() -> tuple[int, ...]:
+    """Build the modbus crc16 lookup table (reflected polynomial 0xA001)."""
+    table = []
+    for table_byte in range(256):
+        crc = table_byte
+        for _ in range(8):
+            if crc & 1:
+                crc >>= 1
+                crc ^= 0xA001
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
 
+# Modbus crc16 value for every possible byte, so the crc is computed per byte instead of per bit
+_CRC16_TABLE: Final = _build_crc16_table()
 
-def computeCRC(data: bytes) -> int:
+
+def computeCRC(data: bytes | memoryview) -> int:
     """Compute a crc16 on the passed in string.
 
     For modbus, this is only used on the binary serial protocols (in this
@@ -25,18 +38,13 @@ def computeCRC(data: bytes) -> int:
 
     Replacement for pymodbus.utilities.computeCRC(...)
     Taken from: https://stackoverflow.com/questions/69369408/calculating-crc16-in-python-for-modbus
-    Adapted to swap buffers
+    Adapted to swap buffers and to use a lookup table instead of the bitwise loop
 
     :param data: The data to create a crc16 of
     :returns: The calculated CRC
     """
     crc = 0xFFFF
+    table = _CRC16_TABLE
     for data_byte in data:
-        crc ^= data_byte
-        for _ in range(8):
-            if crc & 1:
-                crc >>= 1
-                crc ^= 0xA001
-            else:
-                crc >>= 1
+        crc = (crc >> 8) ^ table[(crc ^ data_byte) & 0xFF]
     return ((crc & 0xFF) << 8) | (crc >> 8)